@@ -1,41 +1,368 @@
+import datetime
+import email.utils
+import gzip
+import hashlib
 import http.server
-import socketserver
+import io
+import logging
+import logging.handlers
+import multiprocessing
 import os
+import queue
 import signal
+import socket
 import sys
+import threading
+import urllib.parse
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Serve from the directory containing the HTML file
+SERVE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Sub-resources that may be cached by the browser between reloads
+STATIC_EXTENSIONS = {'.css', '.js', '.png', '.jpg', '.jpeg', '.gif', '.svg', '.ico', '.woff', '.woff2'}
+
+# Request logging goes through a queue so handler threads never block
+# on stdout; the listener thread does the formatting and writing
+_log_queue = queue.Queue(-1)
+_log_handler = logging.StreamHandler(sys.stdout)
+_log_handler.setFormatter(logging.Formatter('[Server] %(message)s'))
+_log_listener = logging.handlers.QueueListener(_log_queue, _log_handler)
+logger = logging.getLogger('mock_checkout')
+logger.addHandler(logging.handlers.QueueHandler(_log_queue))
+logger.setLevel(logging.INFO)
+logger.propagate = False
+
+# Files up to this size are kept in memory after their first request
+CACHE_MAX_SIZE = 256 * 1024
+
+# Text assets that are precompressed when they enter the cache
+COMPRESSIBLE_EXTENSIONS = {'.html', '.htm', '.css', '.js', '.svg', '.json'}
+
+# Filesystem path -> (body, etag, mtime, content type, {encoding: body})
+_file_cache = {}
+
+def compress_variants(data):
+    """Build the encoded variants of a text asset, preferred first."""
+    variants = {}
+    if brotli is not None:
+        variants['br'] = brotli.compress(data, quality=5)
+    variants['gzip'] = gzip.compress(data, 6)
+    # Only keep variants that actually save bytes
+    return {encoding: body for encoding, body in variants.items() if len(body) < len(data)}
+
+def accepted_encodings(header):
+    """Parse an Accept-Encoding header into the set of acceptable codings."""
+    accepted = set()
+    for part in header.split(','):
+        coding, _, params = part.strip().partition(';')
+        params = params.replace(' ', '')
+        if params.startswith('q='):
+            try:
+                if float(params[2:]) <= 0:
+                    continue
+            except ValueError:
+                continue
+        if coding:
+            accepted.add(coding.lower())
+    return accepted
+
+def cache_control_for(url_path, status=200):
+    """Pick the Cache-Control policy for a request path and response status."""
+    # Errors are never cached, or a 404 for a missing asset would stick
+    if not (200 <= status < 300 or status == 304):
+        return 'no-store'
+    # Only the HTML document opts out of caching (auto-reload); static
+    # assets are served from cache for an hour, then revalidated with
+    # If-Modified-Since / If-None-Match
+    ext = os.path.splitext(urllib.parse.urlsplit(url_path).path)[1].lower()
+    if ext in STATIC_EXTENSIONS:
+        return 'public, max-age=3600'
+    return 'no-store, no-cache, must-revalidate'
 
 class AutoReloadHandler(http.server.SimpleHTTPRequestHandler):
+    # Keep connections alive so the browser reuses one socket for all assets
+    protocol_version = "HTTP/1.1"
+    # Set TCP_NODELAY so small responses aren't held back by Nagle, and
+    # buffer writes so headers and body go out in as few sends as possible
+    disable_nagle_algorithm = True
+    wbufsize = 64 * 1024
+
+    # Content types keyed by file extension, shared across requests
+    _mime_cache = {}
+
     def __init__(self, *args, **kwargs):
-        # Ensure we serve from the directory containing the HTML file
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        super().__init__(*args, directory=current_dir, **kwargs)
-        
+        super().__init__(*args, directory=SERVE_DIR, **kwargs)
+
+    def setup(self):
+        super().setup()
+        self.connection.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 256 * 1024)
+
+    def guess_type(self, path):
+        ext = os.path.splitext(path)[1].lower()
+        try:
+            return self._mime_cache[ext]
+        except KeyError:
+            ctype = self._mime_cache[ext] = super().guess_type(path)
+            return ctype
+
     def log_message(self, format, *args):
-        # Override to provide more detailed logging
-        print(f"[Server] {format%args}")
+        logger.info(format, *args)
+
+    def send_head(self):
+        path = self.translate_path(self.path)
+        if os.path.isdir(path):
+            # Let the stock handler redirect or list directories, but
+            # serve an index page from the cache when there is one
+            if not urllib.parse.urlsplit(self.path).path.endswith('/'):
+                return super().send_head()
+            for index in ('index.html', 'index.htm'):
+                if os.path.isfile(os.path.join(path, index)):
+                    path = os.path.join(path, index)
+                    break
+            else:
+                return super().send_head()
+        elif path.endswith('/'):
+            return super().send_head()
+
+        try:
+            st = os.stat(path)
+        except OSError:
+            return super().send_head()
+        if st.st_size > CACHE_MAX_SIZE:
+            return super().send_head()
+
+        entry = _file_cache.get(path)
+        if entry is None or entry[2] != st.st_mtime:
+            try:
+                with open(path, 'rb') as f:
+                    data = f.read()
+            except OSError:
+                return super().send_head()
+            etag = hashlib.blake2b(data, digest_size=16).hexdigest()
+            if os.path.splitext(path)[1].lower() in COMPRESSIBLE_EXTENSIONS:
+                variants = compress_variants(data)
+            else:
+                variants = None
+            entry = _file_cache[path] = (data, etag, st.st_mtime, self.guess_type(path), variants)
+        data, etag, mtime, ctype, variants = entry
+
+        # Pick the best encoding the client accepts (br > gzip > identity);
+        # each variant gets its own ETag since the bytes differ
+        encoding = None
+        if variants:
+            accepted = accepted_encodings(self.headers.get('Accept-Encoding', ''))
+            for candidate in variants:
+                if candidate in accepted:
+                    encoding = candidate
+                    data = variants[candidate]
+                    etag = f'{etag}-{candidate}'
+                    break
+        etag = f'"{etag}"'
+
+        if self._not_modified(etag, mtime):
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            if variants:
+                self.send_header('Vary', 'Accept-Encoding')
+            self.end_headers()
+            return None
+
+        self.send_response(200)
+        self.send_header('Content-type', ctype)
+        if encoding:
+            self.send_header('Content-Encoding', encoding)
+        if variants:
+            self.send_header('Vary', 'Accept-Encoding')
+        self.send_header('Content-Length', str(len(data)))
+        self.send_header('Last-Modified', self.date_time_string(mtime))
+        self.send_header('ETag', etag)
+        self.end_headers()
+        return io.BytesIO(data)
+
+    def _not_modified(self, etag, mtime):
+        """Check the request's conditional headers against a cached file."""
+        if_none_match = self.headers.get('If-None-Match')
+        if if_none_match is not None:
+            tags = [tag.strip() for tag in if_none_match.split(',')]
+            return '*' in tags or etag in tags
+        if_modified_since = self.headers.get('If-Modified-Since')
+        if if_modified_since is None:
+            return False
+        try:
+            since = email.utils.parsedate_to_datetime(if_modified_since)
+        except (TypeError, IndexError, OverflowError, ValueError):
+            return False
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=datetime.timezone.utc)
+        return int(mtime) <= since.timestamp()
+
+    def send_response(self, code, message=None):
+        # Remembered so end_headers can pick the caching policy; send_error
+        # goes through here too
+        self._status = code
+        super().send_response(code, message)
 
     def end_headers(self):
-        # Add auto-reload headers
-        self.send_header('Cache-Control', 'no-store, no-cache, must-revalidate')
+        self.send_header('Cache-Control', cache_control_for(self.path, getattr(self, '_status', 200)))
         super().end_headers()
 
-def run_server(port=8000):
+    def copyfile(self, source, outputfile):
+        # Hand the file body to the kernel with sendfile() instead of
+        # copying it through a userspace buffer
+        try:
+            sendfile = os.sendfile
+            out_fd = outputfile.fileno()
+            in_fd = source.fileno()
+            remaining = os.fstat(in_fd).st_size - source.tell()
+        except (AttributeError, OSError, io.UnsupportedOperation):
+            return super().copyfile(source, outputfile)
+        outputfile.flush()
+        offset = source.tell()
+        while remaining > 0:
+            sent = sendfile(out_fd, in_fd, offset, remaining)
+            if sent == 0:
+                break
+            offset += sent
+            remaining -= sent
+
+class CheckoutHTTPServer(http.server.ThreadingHTTPServer):
+    # Handle each connection on its own thread so one slow client
+    # doesn't stall the page's other asset fetches
+    daemon_threads = True
+    allow_reuse_address = True
+    # Set by worker processes so the kernel balances accept() across them
+    reuse_port = False
+
+    def server_bind(self):
+        if self.reuse_port:
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        super().server_bind()
+
+def _serve(port, reuse_port=False):
+    """Run one server until SIGINT/SIGTERM."""
+    # Allow connections from any network interface
+    server_address = ('0.0.0.0', port)
+    httpd = CheckoutHTTPServer(server_address, AutoReloadHandler, bind_and_activate=False)
+    httpd.reuse_port = reuse_port
+    try:
+        httpd.server_bind()
+        httpd.server_activate()
+    except BaseException:
+        httpd.server_close()
+        raise
+
+    def request_shutdown(signum, frame):
+        # shutdown() blocks until serve_forever() returns, so it has to
+        # run off the serving thread
+        threading.Thread(target=httpd.shutdown, daemon=True).start()
+
+    signal.signal(signal.SIGINT, request_shutdown)
+    signal.signal(signal.SIGTERM, request_shutdown)
+
+    _log_listener.start()
     try:
-        # Allow connections from any network interface
-        server_address = ('0.0.0.0', port)
-        with socketserver.TCPServer(server_address, AutoReloadHandler) as httpd:
-            print(f"Serving mock checkout page at:")
-            print(f"* Local:   http://localhost:{port}")
-            print(f"* Network: http://0.0.0.0:{port}")
-            print("\nPress Ctrl+C to stop the server")
-            httpd.serve_forever()
-    except KeyboardInterrupt:
-        print("\nShutting down server...")
-        httpd.shutdown()
+        httpd.serve_forever()
+    finally:
         httpd.server_close()
-        sys.exit(0)
+        _log_listener.stop()
+
+def run_server(port=8000, workers=1):
+    """Serve the mock checkout page.
+
+    With ``workers`` > 1 that many processes share the port through
+    SO_REUSEPORT (Linux/BSD only); 0 starts one worker per CPU.
+    """
+    if workers == 0:
+        workers = os.cpu_count() or 1
+    if workers > 1 and not hasattr(socket, 'SO_REUSEPORT'):
+        print("SO_REUSEPORT not supported on this platform, using a single process")
+        workers = 1
+
+    print(f"Serving mock checkout page at:")
+    print(f"* Local:   http://localhost:{port}")
+    print(f"* Network: http://0.0.0.0:{port}")
+    if workers > 1:
+        print(f"* Workers: {workers}")
+    print("\nPress Ctrl+C to stop the server")
+
+    if workers == 1:
+        try:
+            _serve(port)
+        finally:
+            print("\nShutting down server...")
+        return
+
+    processes = [
+        multiprocessing.Process(target=_serve, args=(port, True))
+        for _ in range(workers)
+    ]
+
+    def stop_workers(signum, frame):
+        # Ctrl+C already reaches every process in the group; SIGTERM is
+        # only delivered to us, so pass it on
+        if signum == signal.SIGTERM:
+            for process in processes:
+                process.terminate()
+
+    signal.signal(signal.SIGINT, stop_workers)
+    signal.signal(signal.SIGTERM, stop_workers)
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+    print("\nShutting down server...")
+
+def run_asgi_server(port=8000):
+    """Serve the mock checkout page with Starlette on uvicorn.
+
+    Requires the optional ``starlette`` and ``uvicorn`` packages; falls
+    back to the stdlib server when they are not installed.
+    """
+    try:
+        import uvicorn
+        from starlette.applications import Starlette
+        from starlette.routing import Mount
+        from starlette.staticfiles import StaticFiles
+    except ImportError:
+        print("starlette/uvicorn not installed, falling back to http.server")
+        return run_server(port)
+
+    app = Starlette(routes=[Mount('/', app=StaticFiles(directory=SERVE_DIR, html=True))])
+
+    async def cache_control_app(scope, receive, send):
+        # StaticFiles handles ETag/Last-Modified; add our caching policy
+        async def send_with_cache_control(message):
+            if message['type'] == 'http.response.start':
+                headers = list(message.get('headers', []))
+                policy = cache_control_for(scope['path'], message['status'])
+                headers.append((b'cache-control', policy.encode('latin-1')))
+                message = {**message, 'headers': headers}
+            await send(message)
+
+        if scope['type'] != 'http':
+            return await app(scope, receive, send)
+        await app(scope, receive, send_with_cache_control)
+
+    print("Serving mock checkout page (ASGI) at:")
+    print(f"* Local:   http://localhost:{port}")
+    print(f"* Network: http://0.0.0.0:{port}")
+    uvicorn.run(cache_control_app, host='0.0.0.0', port=port, log_level='info')
 
 if __name__ == "__main__":
-    # Handle Ctrl+C gracefully
-    signal.signal(signal.SIGINT, lambda s, f: sys.exit(0))
-    run_server()
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Mock checkout page server")
+    parser.add_argument("--port", type=int, default=8000, help="Port to listen on (default: 8000)")
+    parser.add_argument("--asgi", action="store_true", help="Serve with uvicorn + Starlette instead of http.server")
+    parser.add_argument("--workers", type=int, default=1, help="Server processes sharing the port, 0 for one per CPU (default: 1)")
+    args = parser.parse_args()
+
+    if args.asgi:
+        run_asgi_server(args.port)
+    else:
+        run_server(args.port, args.workers)
@@ -17,41 +17,327 @@ Requirements:
 - Chrome/Firefox WebDriver executable
 """
 
+import atexit
+import concurrent.futures
 import os
 import time
 import logging
+import logging.handlers
 import platform
+import queue
+import random
+import signal
+import socket
+import threading
 from pathlib import Path
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import TimeoutException
 
-# Configure logging
+# Configure logging; records are written by a background listener so a slow
+# disk or console never stalls a WebDriver call
+_log_queue = queue.SimpleQueue()
+_log_listener = logging.handlers.QueueListener(
+    _log_queue,
+    logging.FileHandler("checkout_bot.log"),
+    logging.StreamHandler(),
+    respect_handler_level=True
+)
+_log_listener.start()
+atexit.register(_log_listener.stop)
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler("checkout_bot.log"),
-        logging.StreamHandler()
-    ]
+    handlers=[logging.handlers.QueueHandler(_log_queue)]
 )
 logger = logging.getLogger(__name__)
 
-def launch_chrome_debug(port=9222):
+# Set SIMPLE_BOT_VERBOSE=1 to get chromedriver's verbose protocol log and
+# Selenium's per-command debug output
+VERBOSE_DRIVER_LOG = os.environ.get("SIMPLE_BOT_VERBOSE") == "1"
+if not VERBOSE_DRIVER_LOG:
+    logging.getLogger('selenium').setLevel(logging.WARNING)
+    logging.getLogger('urllib3').setLevel(logging.WARNING)
+
+# Seconds between WebDriverWait polls; most elements show up well within
+# Selenium's default 0.5s, so poll more often
+POLL_FREQUENCY = 0.1
+FAST_POLL_FREQUENCY = 0.05
+
+# Default wait timeouts in seconds. The happy path resolves in milliseconds,
+# so these only bound how long a failed attempt takes before retrying
+TIMEOUT_FAST = 3         # elements on an already loaded page
+TIMEOUT_DEFAULT = 5      # general waits during checkout
+TIMEOUT_NAVIGATION = 10  # waits that span a page load
+
+# Stock check interval used by --fast-poll
+FAST_POLL_INTERVAL = 0.5
+
+# Elements that only appear once the user is logged in
+LOGGED_IN_SELECTOR = ".account-hub, .logged-in"
+
+# Common markers for a ship that can't currently be bought
+OUT_OF_STOCK_SELECTOR = ".out-of-stock, .sold-out, .stock-depleted, .unavailable"
+
+# Opens the offer list if needed, then polls for and clicks the wanted offer,
+# all in one WebDriver call. Resolves to 'ok' or 'timeout'
+SELECT_OFFER_JS = """
+const [viewSelector, offerSelector, timeoutMs] = arguments;
+const viewOffers = document.querySelector(viewSelector);
+if (viewOffers) viewOffers.click();
+return new Promise(resolve => {
+    const start = performance.now();
+    const poll = () => {
+        const offer = document.querySelector(offerSelector);
+        if (offer) {
+            offer.scrollIntoView({block: 'center'});
+            offer.click();
+            resolve('ok');
+        } else if (performance.now() - start < timeoutMs) {
+            setTimeout(poll, 50);
+        } else {
+            resolve('timeout');
+        }
+    };
+    poll();
+});
+"""
+
+# Waits for the ship page, selects the offer, then reads the stock state from
+# the same DOM and clicks add to cart right away if the ship is available.
+# Resolves to {offerSelected, inStock}
+BOOTSTRAP_SHIP_JS = """
+const [pageSelector, viewSelector, offerSelector, outOfStockSelector, addToCartSelector, timeoutMs] = arguments;
+return new Promise(resolve => {
+    const start = performance.now();
+    let viewed = false;
+    const poll = () => {
+        if (document.querySelector(pageSelector)) {
+            if (!viewed) {
+                const viewOffers = document.querySelector(viewSelector);
+                if (viewOffers) viewOffers.click();
+                viewed = true;
+            }
+            const offer = document.querySelector(offerSelector);
+            if (offer) {
+                offer.scrollIntoView({block: 'center'});
+                offer.click();
+                const button = document.querySelector(addToCartSelector);
+                const inStock = !document.querySelector(outOfStockSelector) && !!button && !button.disabled;
+                if (inStock) button.click();
+                resolve({offerSelected: true, inStock: inStock});
+                return;
+            }
+        }
+        if (performance.now() - start < timeoutMs) {
+            setTimeout(poll, 50);
+        } else {
+            resolve({offerSelected: false, inStock: false});
+        }
+    };
+    poll();
+});
+"""
+
+# Fills in and applies the coupon (skipped when null) and store credit in one
+# WebDriver call. Values go through the native setter and input/change events
+# so the page's framework sees them. Returns the selectors it couldn't find
+APPLY_DISCOUNTS_JS = """
+const [couponField, applyCoupon, couponCode, creditField, applyCredit, creditAmount] = arguments;
+const setValue = Object.getOwnPropertyDescriptor(HTMLInputElement.prototype, 'value').set;
+const missing = [];
+const apply = (fieldSelector, buttonSelector, value) => {
+    const field = document.querySelector(fieldSelector);
+    const button = document.querySelector(buttonSelector);
+    if (!field) missing.push(fieldSelector);
+    if (!button) missing.push(buttonSelector);
+    if (!field || !button) return;
+    setValue.call(field, value);
+    field.dispatchEvent(new Event('input', {bubbles: true}));
+    field.dispatchEvent(new Event('change', {bubbles: true}));
+    button.click();
+};
+if (couponCode !== null) apply(couponField, applyCoupon, couponCode);
+apply(creditField, applyCredit, creditAmount);
+return missing;
+"""
+
+# Image requests, blocked in addition when the bot runs with block_images
+BLOCKED_IMAGE_PATTERNS = ["*.jpg", "*.jpeg", "*.png", "*.gif", "*.webp", "*.avif"]
+
+# Third-party trackers and media the checkout flow never needs
+BLOCKED_URL_PATTERNS = [
+    "*.googletagmanager.com/*",
+    "*.google-analytics.com/*",
+    "*.doubleclick.net/*",
+    "*.facebook.net/*",
+    "*.hotjar.com/*",
+    "*.youtube.com/*",
+    "*.ttf",
+    "*.woff",
+    "*.woff2",
+    "*.mp4",
+    "*.webm",
+]
+
+def _block_heavy_resources(driver, patterns=None):
+    """
+    Stop Chrome from fetching resources that slow down every page load.
+    
+    Args:
+        driver: Chrome WebDriver instance
+        patterns (list): URL patterns to block (default: BLOCKED_URL_PATTERNS)
+    """
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns or BLOCKED_URL_PATTERNS})
+    except Exception as e:
+        logger.warning(f"Could not block heavy resources: {str(e)}")
+
+def _retry_delay(attempt, retry_interval):
+    """
+    Seconds to wait before the next stock check.
+    
+    Starts short and doubles per attempt up to retry_interval, with a little
+    jitter so parallel bots don't poll in lockstep.
+    
+    Args:
+        attempt (int): Number of the attempt that just failed (1-based)
+        retry_interval (float): Upper bound for the backoff
+    """
+    return min(retry_interval, 0.25 * (2 ** min(attempt, 5))) + random.uniform(0, 0.25)
+
+# Returns the first visible, enabled element among the selectors, tried in order
+FIRST_CLICKABLE_JS = """
+for (const selector of arguments[0]) {
+    const el = document.querySelector(selector);
+    if (el && !el.disabled && el.getClientRects().length) return el;
+}
+return null;
+"""
+
+def _first_clickable(selector_list):
+    """
+    Wait condition that resolves a selector list in the page in one call.
+    
+    The alternatives are tried one at a time, IDs first and then shortest
+    first, instead of Selenium's separate find, displayed and enabled
+    round trips.
+    
+    Args:
+        selector_list (str): Comma-separated CSS selector alternatives
+    """
+    selectors = sorted(
+        (part.strip() for part in selector_list.split(',')),
+        key=lambda part: (not part.startswith('#'), len(part))
+    )
+    
+    def condition(driver):
+        return driver.execute_script(FIRST_CLICKABLE_JS, selectors) or False
+    return condition
+
+def _logged_in(driver):
+    """Wait condition for a completed login."""
+    return "account" in driver.current_url or driver.find_elements(By.CSS_SELECTOR, LOGGED_IN_SELECTOR)
+
+def _debug_port_open(port, timeout=0.1):
+    """
+    Check whether something is listening on the local debug port.
+    
+    Args:
+        port (int): Debug port to probe
+        timeout (float): Connection timeout in seconds
+    
+    Returns:
+        bool: True if a connection could be made
+    """
+    try:
+        with socket.create_connection(("127.0.0.1", port), timeout=timeout):
+            return True
+    except OSError:
+        return False
+
+def _wait_for_debug_port(port, timeout=5.0, interval=0.05):
+    """
+    Wait until Chrome is accepting connections on its debug port.
+    
+    Args:
+        port (int): Debug port to poll
+        timeout (float): Maximum seconds to wait
+        interval (float): Seconds between connection attempts
+    
+    Raises:
+        TimeoutError: If the port does not open in time
+    """
+    deadline = time.monotonic() + timeout
+    while not _debug_port_open(port):
+        if time.monotonic() >= deadline:
+            raise TimeoutError(f"Chrome debug port {port} did not open within {timeout}s")
+        time.sleep(interval)
+
+def _resolve_chromedriver():
+    """
+    Locate a chromedriver matching the installed Chrome via Selenium Manager.
+    
+    Returns:
+        str: Path to the chromedriver executable
+    """
+    from selenium.webdriver.chrome.service import Service
+    from selenium.webdriver.common.driver_finder import DriverFinder
+    return DriverFinder(Service(), webdriver.ChromeOptions()).get_driver_path()
+
+def _tune_command_connection(driver, pool_maxsize=10):
+    """
+    Reuse HTTP connections for WebDriver commands.
+    
+    Every Selenium command is an HTTP request to the driver process; keep
+    those sockets alive and allow more than one pooled connection per host.
+    
+    Args:
+        driver: WebDriver instance to tune
+        pool_maxsize (int): Connections kept per host in the pool
+    """
+    import urllib3
+    
+    executor = driver.command_executor
+    client_config = getattr(executor, '_client_config', None)
+    if client_config is not None:
+        client_config.keep_alive = True
+    else:
+        executor.keep_alive = True
+    
+    old_conn = getattr(executor, '_conn', None)
+    if isinstance(old_conn, urllib3.ProxyManager):
+        # Leave proxied connections as Selenium configured them
+        return
+    pool_args = dict(old_conn.connection_pool_kw) if old_conn is not None else {}
+    pool_args.update(maxsize=pool_maxsize, block=False)
+    executor._conn = urllib3.PoolManager(**pool_args)
+    if old_conn is not None:
+        old_conn.clear()
+
+def launch_chrome_debug(port=9222, user_data_dir='remote-profile'):
     """
     Launch Chrome in debug mode for remote automation.
     
     Args:
         port (int): Debug port to use (default: 9222)
+        user_data_dir (str): Profile directory for this Chrome instance; each
+                             concurrent instance needs its own
     
     Returns:
-        subprocess.Popen: Process handle for the Chrome instance
+        subprocess.Popen: Process handle for the Chrome instance, or None if
+                          Chrome is already listening on the port
     """
     import subprocess
     import platform
     
+    if _debug_port_open(port):
+        logger.info(f"Chrome already listening on debug port {port}")
+        return None
+    
     if platform.system() == 'Windows':
         chrome_path = r'C:\Program Files\Google\Chrome\Application\chrome.exe'
         if not os.path.exists(chrome_path):
@@ -64,7 +350,7 @@ def launch_chrome_debug(port=9222):
     cmd = [
         chrome_path,
         f'--remote-debugging-port={port}',
-        '--user-data-dir=remote-profile',
+        f'--user-data-dir={user_data_dir}',
         '--no-first-run',
         '--no-default-browser-check',
         '--start-maximized'
@@ -79,8 +365,60 @@ def launch_chrome_debug(port=9222):
         raise
 
 class StarCitizenCheckoutBot:
+    # Locators, built once and shared by every call
+    LOC_USERNAME = (By.ID, "handle")
+    LOC_PASSWORD = (By.ID, "password")
+    LOC_LOGIN_BUTTON = (By.CSS_SELECTOR, "button[type='submit']")
+    LOC_HTML = (By.TAG_NAME, "html")
+    LOC_PAGE_PLEDGE = (By.CSS_SELECTOR, ".page-pledge")
+    LOC_OUT_OF_STOCK = (By.CSS_SELECTOR, OUT_OF_STOCK_SELECTOR)
+    LOC_ADD_TO_CART = (By.CSS_SELECTOR, ".js-store-add-to-cart, .btn-add-to-cart")
+    LOC_CART_NOTIFICATION = (By.CSS_SELECTOR, ".js-cart-notification, .notification-success")
+    LOC_VIEW_OFFERS = (By.CSS_SELECTOR, ".js-view-offers, .view-offers-btn")
+    LOC_WARBOND_OFFER = (By.CSS_SELECTOR, "[data-warbond='true'], .warbond-offer")
+    LOC_STANDARD_OFFER = (By.CSS_SELECTOR, "[data-warbond='false'], .standard-offer")
+    LOC_CHECKOUT_BUTTON = (By.CSS_SELECTOR, ".js-checkout-button, .btn-checkout")
+    LOC_CHECKOUT_STEP = (By.CSS_SELECTOR, ".checkout-step")
+    LOC_COUPON_FIELD = (By.CSS_SELECTOR, ".js-coupon-field, #coupon-code")
+    LOC_APPLY_COUPON = (By.CSS_SELECTOR, ".js-apply-coupon, .btn-apply-coupon")
+    LOC_COUPON_APPLIED = (By.CSS_SELECTOR, ".coupon-applied, .notification-success")
+    LOC_CREDIT_FIELD = (By.CSS_SELECTOR, ".js-store-credit-field, #store-credit")
+    LOC_APPLY_CREDIT = (By.CSS_SELECTOR, ".js-apply-credit, .btn-apply-credit")
+    LOC_CREDIT_APPLIED = (By.CSS_SELECTOR, ".credit-applied, .notification-success")
+    LOC_PROCEED_TO_PAYMENT = (By.CSS_SELECTOR, ".js-proceed-to-payment, .btn-proceed")
+    LOC_PAYMENT_OPTIONS = (By.CSS_SELECTOR, ".payment-methods, .payment-options")
+    LOC_DISCLAIMER_DIALOG = (By.CSS_SELECTOR, ".disclaimer-dialog, #disclaimer-popup")
+    LOC_DISCLAIMER_CHECKBOXES = (By.CSS_SELECTOR, "input[type='checkbox']:not(:checked)")
+    LOC_AGREE_BUTTON = (By.CSS_SELECTOR, ".js-agree-button, #agree-button")
+    LOC_CONTINUE = (By.CSS_SELECTOR, ".js-continue, .continue-btn")
+    LOC_ADDRESS_STEP = (By.CSS_SELECTOR, ".address-step, #shipping-step")
+    LOC_PROCEED_PAY = (By.CSS_SELECTOR, ".js-proceed-pay, .proceed-to-pay")
+    LOC_PAYMENT_STEP = (By.CSS_SELECTOR, ".payment-step, #payment-step")
+    
+    # Wait conditions, built once and shared by every call
+    EC_PAGE_PLEDGE = staticmethod(EC.presence_of_element_located(LOC_PAGE_PLEDGE))
+    EC_ADD_TO_CART_CLICKABLE = staticmethod(_first_clickable(LOC_ADD_TO_CART[1]))
+    EC_CART_NOTIFICATION = staticmethod(EC.presence_of_element_located(LOC_CART_NOTIFICATION))
+    EC_USERNAME = staticmethod(EC.presence_of_element_located(LOC_USERNAME))
+    EC_PASSWORD_CLICKABLE = staticmethod(EC.element_to_be_clickable(LOC_PASSWORD))
+    EC_LOGIN_BUTTON = staticmethod(EC.presence_of_element_located(LOC_LOGIN_BUTTON))
+    EC_CHECKOUT_BUTTON_CLICKABLE = staticmethod(_first_clickable(LOC_CHECKOUT_BUTTON[1]))
+    EC_CHECKOUT_STEP = staticmethod(EC.presence_of_element_located(LOC_CHECKOUT_STEP))
+    EC_COUPON_APPLIED = staticmethod(EC.presence_of_element_located(LOC_COUPON_APPLIED))
+    EC_CREDIT_FIELD = staticmethod(EC.presence_of_element_located(LOC_CREDIT_FIELD))
+    EC_CREDIT_APPLIED = staticmethod(EC.presence_of_element_located(LOC_CREDIT_APPLIED))
+    EC_PROCEED_TO_PAYMENT_CLICKABLE = staticmethod(_first_clickable(LOC_PROCEED_TO_PAYMENT[1]))
+    EC_PAYMENT_OPTIONS = staticmethod(EC.presence_of_element_located(LOC_PAYMENT_OPTIONS))
+    EC_DISCLAIMER_DIALOG = staticmethod(EC.presence_of_element_located(LOC_DISCLAIMER_DIALOG))
+    EC_AGREE_BUTTON_CLICKABLE = staticmethod(_first_clickable(LOC_AGREE_BUTTON[1]))
+    EC_CONTINUE_CLICKABLE = staticmethod(_first_clickable(LOC_CONTINUE[1]))
+    EC_ADDRESS_STEP = staticmethod(EC.presence_of_element_located(LOC_ADDRESS_STEP))
+    EC_PROCEED_PAY_CLICKABLE = staticmethod(_first_clickable(LOC_PROCEED_PAY[1]))
+    EC_PAYMENT_STEP = staticmethod(EC.presence_of_element_located(LOC_PAYMENT_STEP))
+    
     def __init__(self, browser='chrome', headless=False, ship_url=None, warbond=False, 
-                 store_credit_amount=1385, profile=None, use_existing_browser=True, **kwargs):
+                 store_credit_amount=1385, profile=None, use_existing_browser=True,
+                 timeout=TIMEOUT_DEFAULT, **kwargs):
         """
         Initialize the checkout bot.
         
@@ -92,127 +430,70 @@ class StarCitizenCheckoutBot:
             store_credit_amount (int): Amount of store credit to apply
             profile (str): Browser profile name to use (e.g., 'Default' or 'Sean')
             use_existing_browser (bool): Whether to connect to an existing Chrome instance (default: True)
-            **kwargs: Additional browser-specific options
+            timeout (float): Seconds the shared waits allow before giving up
+            **kwargs: Additional browser-specific options (e.g. debug_port and
+                      debug_user_data_dir for the debug-mode Chrome instance,
+                      block_images to skip loading images in Chrome, or
+                      stock_url for a JSON endpoint reporting availability, or
+                      max_checkout_retries for reaching the checkout page)
         """
         self.logger = logger  # Initialize logger
         self.ship_url = ship_url or "https://robertsspaceindustries.com/en/pledge/ships/aegis-idris/Idris-P"
         self.coupon_code = None  # Will be provided by user
         self.store_credit_amount = store_credit_amount
         self.warbond = warbond
+        self.block_images = kwargs.get('block_images', False)
+        self.stock_url = kwargs.get('stock_url')
+        self.max_checkout_retries = kwargs.get('max_checkout_retries', 3)
+        self._stock_session = None
         
-        # Setup browser with automatic webdriver management
+        # Setup browser; Selenium Manager resolves the matching driver binary
         try:
             if browser.lower() == 'chrome':
                 from selenium.webdriver.chrome.service import Service
-                from webdriver_manager.chrome import ChromeDriverManager
-                options = webdriver.ChromeOptions()
-                
-                # Core stability options
-                options.add_argument('--no-sandbox')
-                options.add_argument('--disable-dev-shm-usage')
-                options.add_argument('--disable-gpu')
-                options.add_argument('--disable-software-rasterizer')
-                
-                # Performance and reliability options
-                options.add_argument('--disable-extensions')
-                options.add_argument('--disable-notifications')
-                options.add_argument('--ignore-certificate-errors')
-                options.add_argument('--start-maximized')
-                options.add_argument('--window-size=1920,1080')  # Explicit window size
-                options.add_argument('--remote-debugging-port=9222')  # Enable debugging
-                options.add_argument('--disable-popup-blocking')  # Handle popups
-                options.add_argument('--disable-blink-features')  # Disable Blink features that can cause issues
-                
-                # Memory and process management
-                options.add_argument('--disable-background-networking')
-                options.add_argument('--disable-backgrounding-occluded-windows')
-                options.add_argument('--disable-breakpad')
-                options.add_argument('--disable-component-update')  # Prevent updates during runtime
-                options.add_argument('--disable-domain-reliability')
-                options.add_argument('--disable-sync')  # Disable Chrome sync
-                
-                # Advanced stability options
-                options.add_argument('--force-color-profile=srgb')  # Consistent color rendering
-                options.add_argument('--metrics-recording-only')  # Minimal performance impact
-                options.add_argument('--no-first-run')  # Skip first run wizards
-                options.add_argument('--password-store=basic')
-                
-                # Automation-related options
-                options.add_experimental_option('excludeSwitches', [
-                    'enable-logging',
-                    'enable-automation',
-                    'ignore-certificate-errors'
-                ])
-                options.add_experimental_option('useAutomationExtension', False)
-                options.add_experimental_option('w3c', True)  # Enable W3C compliance
                 
                 # Handle browser connection mode
                 debug_port = kwargs.get('debug_port', 9222)
+                debugger_address = None
+                
+                # Resolve chromedriver in the background while Chrome starts up
+                driver_executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+                driver_future = driver_executor.submit(_resolve_chromedriver)
+                driver_executor.shutdown(wait=False)
+                
                 if use_existing_browser:
                     try:
                         # Launch or connect to debug mode Chrome
                         self.logger.info("Attempting to connect to existing Chrome instance...")
-                        chrome_process = launch_chrome_debug(port=debug_port)
-                        time.sleep(2)  # Give Chrome time to start
+                        chrome_process = launch_chrome_debug(
+                            port=debug_port,
+                            user_data_dir=kwargs.get('debug_user_data_dir', 'remote-profile')
+                        )
+                        _wait_for_debug_port(debug_port)
                         
-                        options.add_experimental_option("debuggerAddress", f"127.0.0.1:{debug_port}")
+                        debugger_address = f"127.0.0.1:{debug_port}"
                         self.logger.info(f"Successfully connected to Chrome on port {debug_port}")
                     except Exception as e:
                         self.logger.warning(f"Failed to connect to existing Chrome: {e}")
                         self.logger.info("Falling back to new browser window")
-                        # Set fallback options for new window
-                        options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
-                        options.add_argument('--disable-blink-features=AutomationControlled')
-                        options.add_experimental_option("excludeSwitches", ["enable-automation"])
-                        options.add_experimental_option('useAutomationExtension', False)
                 else:
                     self.logger.info("Using new browser window as requested")
-                    options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
-                    options.add_argument('--disable-blink-features=AutomationControlled')
-                    options.add_experimental_option("excludeSwitches", ["enable-automation"])
-                    options.add_experimental_option('useAutomationExtension', False)
                 
-                # Use existing profile and cookies
-                if platform.system() == 'Windows':
-                    user_data_dir = os.path.join(os.getenv('LOCALAPPDATA'), 'Google', 'Chrome', 'User Data')
-                elif platform.system() == 'Darwin':  # macOS
-                    user_data_dir = os.path.expanduser('~/Library/Application Support/Google/Chrome')
-                else:  # Linux
-                    user_data_dir = os.path.expanduser('~/.config/google-chrome')
-                
-                if os.path.exists(user_data_dir):
-                    options.add_argument(f'user-data-dir={user_data_dir}')
-                    # Use specified profile or default
-                    profile_dir = profile or 'Default'
-                    profile_path = os.path.join(user_data_dir, profile_dir)
-                    
-                    if os.path.exists(profile_path):
-                        options.add_argument(f'--profile-directory={profile_dir}')
-                        self.logger.info(f"Using Chrome profile: {profile_dir}")
-                    else:
-                        self.logger.warning(f"Profile '{profile_dir}' not found, using Default")
-                        options.add_argument('--profile-directory=Default')
-                
-                # Additional options for stability
-                options.add_argument('--no-sandbox')
-                options.add_argument('--disable-dev-shm-usage')
-                options.add_argument('--disable-gpu')
-                options.add_experimental_option('excludeSwitches', ['enable-logging'])
-                
-                if headless:
-                    options.add_argument('--headless')
+                try:
+                    driver_path = driver_future.result()
+                except Exception as e:
+                    # Leave it to the Service to resolve (and report) on start
+                    self.logger.warning(f"Could not resolve chromedriver up front: {str(e)}")
+                    driver_path = None
                 
                 max_retries = 3
-                retry_count = 0
-                
-                while retry_count < max_retries:
+                for attempt in range(1, max_retries + 1):
+                    options = self._build_chrome_options(profile, headless, debugger_address)
                     try:
-                        driver_path = ChromeDriverManager().install()
                         service = Service(
                             driver_path,
-                            start_error_message="Chrome failed to start (Timeout)",
-                            service_args=['--verbose'],
-                            log_path='chromedriver.log'
+                            service_args=['--verbose'] if VERBOSE_DRIVER_LOG else [],
+                            log_output='chromedriver.log' if VERBOSE_DRIVER_LOG else os.devnull
                         )
                         service.connection_timeout = 60
                         
@@ -223,44 +504,29 @@ class StarCitizenCheckoutBot:
                         self.logger.info(f"Chrome initialized with profile: {profile}")
                         break
                     except Exception as e:
-                        retry_count += 1
-                        self.logger.warning(f"Chrome initialization attempt {retry_count} failed: {str(e)}")
-                        time.sleep(5)
-                        
-                        if retry_count >= max_retries:
-                            self.logger.error(f"Failed to initialize Chrome after {max_retries} attempts")
-                            self.logger.error("Trying without user profile...")
-                            break
-                    
-                    # Retry without profile but keep security settings
-                    options = webdriver.ChromeOptions()
-                    
-                    # Core security and stability options
-                    options.add_argument('--no-sandbox')
-                    options.add_argument('--disable-dev-shm-usage')
-                    options.add_argument('--disable-gpu')
-                    options.add_argument('--disable-extensions')
-                    options.add_argument('--ignore-certificate-errors')
-                    options.add_argument('--password-store=basic')
-                    options.add_experimental_option('excludeSwitches', ['enable-logging', 'enable-automation'])
-                    options.add_experimental_option('useAutomationExtension', False)
+                        self.logger.warning(f"Chrome initialization attempt {attempt} failed: {str(e)}")
+                        if attempt < max_retries:
+                            time.sleep(attempt)
+                else:
+                    self.logger.error(f"Failed to initialize Chrome after {max_retries} attempts")
+                    self.logger.error("Trying without user profile...")
                     
-                    if headless:
-                        options.add_argument('--headless')
-                        
+                    # Retry in a fresh window without profile but keep security settings
+                    options = self._build_chrome_options(profile, headless, use_profile=False)
                     try:
-                        self.driver = webdriver.Chrome(
-                            service=Service(ChromeDriverManager().install()),
-                            options=options
-                        )
+                        self.driver = webdriver.Chrome(service=Service(driver_path), options=options)
                         self.logger.info("Successfully initialized Chrome without profile")
                     except Exception as retry_error:
                         self.logger.error(f"Failed to initialize Chrome even without profile: {str(retry_error)}")
                         self.logger.error("Please check if Chrome is properly installed and up to date")
                         raise
+                
+                if self.block_images and debugger_address:
+                    # An attached Chrome was started without our flags
+                    _block_heavy_resources(self.driver, BLOCKED_URL_PATTERNS + BLOCKED_IMAGE_PATTERNS)
+                else:
+                    _block_heavy_resources(self.driver)
             elif browser.lower() == 'firefox':
-                from selenium.webdriver.firefox.service import Service
-                from webdriver_manager.firefox import GeckoDriverManager
                 options = webdriver.FirefoxOptions()
                 
                 # Security and stability preferences
@@ -295,14 +561,20 @@ class StarCitizenCheckoutBot:
                     profile_base = os.path.expanduser('~/.mozilla/firefox')
                 
                 profile_name = kwargs.get('profile', None)
-                if os.path.exists(profile_base) and profile_name:
-                    # Look for profile by name
-                    for dir_name in os.listdir(profile_base):
-                        if profile_name.lower() in dir_name.lower():
-                            profile_path = os.path.join(profile_base, dir_name)
-                            logger.info(f"Found Firefox profile at: {profile_path}")
-                            options.set_preference('profile', profile_path)
-                            break
+                if profile_name:
+                    # Look for profile by name, stopping at the first match
+                    wanted = profile_name.lower()
+                    try:
+                        profile_path = next(
+                            (entry for entry in Path(profile_base).iterdir() if wanted in entry.name.lower()),
+                            None
+                        )
+                    except OSError:
+                        profile_path = None
+                    
+                    if profile_path:
+                        logger.info(f"Found Firefox profile at: {profile_path}")
+                        options.set_preference('profile', str(profile_path))
                     else:
                         logger.warning(f"Firefox profile '{profile_name}' not found, using default")
                 
@@ -310,10 +582,7 @@ class StarCitizenCheckoutBot:
                     options.add_argument('--headless')
                 
                 try:
-                    self.driver = webdriver.Firefox(
-                        service=Service(GeckoDriverManager().install()),
-                        options=options
-                    )
+                    self.driver = webdriver.Firefox(options=options)
                     logger.info("Firefox initialized successfully")
                 except Exception as e:
                     logger.error(f"Failed to initialize Firefox with profile: {str(e)}")
@@ -322,10 +591,7 @@ class StarCitizenCheckoutBot:
                     options = webdriver.FirefoxOptions()
                     if headless:
                         options.add_argument('--headless')
-                    self.driver = webdriver.Firefox(
-                        service=Service(GeckoDriverManager().install()),
-                        options=options
-                    )
+                    self.driver = webdriver.Firefox(options=options)
             elif browser.lower() == 'safari':
                 # Safari setup
                 try:
@@ -414,11 +680,198 @@ class StarCitizenCheckoutBot:
             logger.error("3. Required packages are installed (run reset_and_test.bat)")
             raise
         
-        self.driver.maximize_window()
-        self.wait = WebDriverWait(self.driver, 15)
+        try:
+            _tune_command_connection(self.driver)
+        except Exception as e:
+            logger.warning(f"Could not enable WebDriver keep-alive: {str(e)}")
+        
+        # Chrome already starts maximized from its command line flag
+        if browser.lower() != 'chrome':
+            self.driver.maximize_window()
+        # All waiting goes through the explicit waits below; an implicit wait
+        # would stall every failed lookup inside them first
+        self.driver.implicitly_wait(0)
+        self.timeout = timeout
+        self._waits = {}
+        self.wait = self._wait(timeout)
+        # Tighter polling for the time-critical add to cart window
+        self.fast_wait = self._wait(min(timeout, TIMEOUT_FAST), FAST_POLL_FREQUENCY)
         logger.info(f"Initialized bot with {browser} browser")
     
-    def login(self, username, password, max_retries=3):
+    def _wait(self, timeout, poll_frequency=POLL_FREQUENCY):
+        """
+        Get a WebDriverWait for the given timeout and poll frequency.
+        
+        Waits are created on first use and reused afterwards.
+        
+        Args:
+            timeout (float): Seconds to wait before giving up
+            poll_frequency (float): Seconds between checks
+        
+        Returns:
+            WebDriverWait: Shared wait for this driver
+        """
+        key = (timeout, poll_frequency)
+        wait = self._waits.get(key)
+        if wait is None:
+            wait = self._waits[key] = WebDriverWait(self.driver, timeout, poll_frequency=poll_frequency)
+        return wait
+    
+    def _build_chrome_options(self, profile, headless, debugger_address=None, use_profile=True):
+        """
+        Build a fresh set of Chrome options for one start attempt.
+        
+        Args:
+            profile (str): Chrome profile directory to use (defaults to 'Default')
+            headless (bool): Run browser in headless mode
+            debugger_address (str, optional): Attach to the Chrome instance listening here
+            use_profile (bool): Whether to load the user's Chrome profile
+        
+        Returns:
+            ChromeOptions: Options for webdriver.Chrome
+        """
+        options = webdriver.ChromeOptions()
+        # Return from get() once the DOM is ready; every step waits
+        # for the element it needs anyway
+        options.page_load_strategy = 'eager'
+        
+        if debugger_address:
+            # Chrome is already running, so launch flags would be ignored
+            options.add_experimental_option("debuggerAddress", debugger_address)
+            return options
+        
+        # Core stability options
+        options.add_argument('--no-sandbox')
+        options.add_argument('--disable-dev-shm-usage')
+        options.add_argument('--disable-gpu')
+        
+        # Window and behaviour options
+        options.add_argument('--disable-notifications')
+        options.add_argument('--ignore-certificate-errors')
+        options.add_argument('--start-maximized')
+        options.add_argument('--remote-debugging-port=9222')  # Enable debugging
+        options.add_argument('--disable-popup-blocking')  # Handle popups
+        options.add_argument('--no-first-run')  # Skip first run wizards
+        options.add_argument('--password-store=basic')
+        
+        # Automation-related options
+        options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
+        options.add_argument('--disable-blink-features=AutomationControlled')
+        options.add_experimental_option('excludeSwitches', [
+            'enable-logging',
+            'enable-automation',
+            'ignore-certificate-errors'
+        ])
+        options.add_experimental_option('useAutomationExtension', False)
+        
+        if use_profile:
+            # Use existing profile and cookies
+            if platform.system() == 'Windows':
+                user_data_dir = os.path.join(os.getenv('LOCALAPPDATA'), 'Google', 'Chrome', 'User Data')
+            elif platform.system() == 'Darwin':  # macOS
+                user_data_dir = os.path.expanduser('~/Library/Application Support/Google/Chrome')
+            else:  # Linux
+                user_data_dir = os.path.expanduser('~/.config/google-chrome')
+            
+            # Use specified profile or default; an existing profile implies an
+            # existing user data dir, so the common case needs a single stat
+            profile_dir = profile or 'Default'
+            if Path(user_data_dir, profile_dir).exists():
+                options.add_argument(f'user-data-dir={user_data_dir}')
+                options.add_argument(f'--profile-directory={profile_dir}')
+                self.logger.info(f"Using Chrome profile: {profile_dir}")
+            elif os.path.exists(user_data_dir):
+                options.add_argument(f'user-data-dir={user_data_dir}')
+                self.logger.warning(f"Profile '{profile_dir}' not found, using Default")
+                options.add_argument('--profile-directory=Default')
+        else:
+            options.add_argument('--disable-extensions')
+        
+        if self.block_images:
+            # Adding to cart doesn't need the pledge page's artwork
+            options.add_argument('--blink-settings=imagesEnabled=false')
+        
+        if headless:
+            # The new headless mode shares the regular renderer (Chrome 109+)
+            options.add_argument('--headless=new')
+            # --start-maximized has no effect without a screen
+            options.add_argument('--window-size=1920,1080')
+        
+        return options
+    
+    def _type_text(self, element, text, typing_delay=0):
+        """
+        Type text into an element.
+        
+        Args:
+            element: Element to type into
+            text (str): Text to enter
+            typing_delay (float): Seconds to pause between keystrokes; 0 sends
+                                  the whole string in a single call
+        """
+        if typing_delay <= 0:
+            element.send_keys(text)
+            return
+        for char in text:
+            element.send_keys(char)
+            time.sleep(typing_delay)
+    
+    def _clear_site_cookies(self):
+        """Clear the RSI site's cookies in one call, leaving other sites' sessions alone."""
+        try:
+            self.driver.execute_cdp_cmd("Storage.clearDataForOrigin", {
+                "origin": "https://robertsspaceindustries.com",
+                "storageTypes": "cookies"
+            })
+        except AttributeError:
+            # Non-Chromium drivers have no CDP; delete cookie by cookie instead
+            self.driver.delete_all_cookies()
+    
+    def _js_query(self, selectors):
+        """
+        Look up several CSS selectors in a single WebDriver call.
+        
+        Args:
+            selectors (dict): Names mapped to CSS selectors
+        
+        Returns:
+            dict: The same names mapped to the first matching element, or None
+        """
+        return self.driver.execute_script(
+            "return Object.fromEntries(Object.entries(arguments[0])"
+            ".map(([name, selector]) => [name, document.querySelector(selector)]));",
+            selectors
+        )
+    
+    def _all_present(self, **selectors):
+        """Wait condition that returns the _js_query hits once every selector matches."""
+        def condition(driver):
+            hits = self._js_query(selectors)
+            return hits if all(hits.values()) else False
+        return condition
+    
+    def _fast_fill(self, element, value):
+        """
+        Set an input's value in one call, replacing what was there.
+        
+        Uses the native value setter and fires input/change events so the
+        page's framework registers the new value.
+        
+        Args:
+            element: Input element to fill
+            value (str): Value to set
+        """
+        self.driver.execute_script(
+            "const setValue = Object.getOwnPropertyDescriptor(HTMLInputElement.prototype, 'value').set;"
+            "setValue.call(arguments[0], arguments[1]);"
+            "arguments[0].dispatchEvent(new Event('input', {bubbles: true}));"
+            "arguments[0].dispatchEvent(new Event('change', {bubbles: true}));",
+            element,
+            value
+        )
+    
+    def login(self, username, password, max_retries=3, typing_delay=0,
+              timeout=TIMEOUT_NAVIGATION, field_timeout=TIMEOUT_FAST):
         """
         Log in to the Star Citizen website.
         
@@ -426,29 +879,32 @@ class StarCitizenCheckoutBot:
             username (str): RSI account username
             password (str): RSI account password
             max_retries (int): Maximum number of login attempts
+            typing_delay (float): Seconds between keystrokes when entering
+                                  credentials (default: 0, type all at once)
+            timeout (float): Seconds to wait for the login page to load and
+                             for the login to be confirmed
+            field_timeout (float): Seconds to wait for each form control once
+                                   the page is up
         """
         retry_count = 0
         while retry_count < max_retries:
             try:
-                # Clear cookies and cache before login attempt
-                self.driver.delete_all_cookies()
+                # Clear cookies before login attempt
+                self._clear_site_cookies()
                 
-                # Navigate to login page with page load strategy
+                # Navigate to login page (returns once the DOM is interactive)
                 logger.info("Navigating to login page")
                 self.driver.get("https://robertsspaceindustries.com/sign-in")
                 
-                # Wait for page to be fully loaded
-                self.wait.until(lambda driver: driver.execute_script('return document.readyState') == 'complete')
-                
-                # Wait for login form with extended timeout
-                username_field = WebDriverWait(self.driver, 30).until(
-                    EC.presence_of_element_located((By.ID, "handle")),
+                # Wait for the login form to render
+                username_field = self._wait(timeout).until(
+                    self.EC_USERNAME,
                     message="Username field not found"
                 )
                 
                 # Ensure fields are interactable
-                password_field = WebDriverWait(self.driver, 15).until(
-                    EC.element_to_be_clickable((By.ID, "password")),
+                password_field = self._wait(field_timeout).until(
+                    self.EC_PASSWORD_CLICKABLE,
                     message="Password field not found or not clickable"
                 )
                 
@@ -456,31 +912,23 @@ class StarCitizenCheckoutBot:
                 username_field.clear()
                 password_field.clear()
                 
-                # Enter credentials with delay between keystrokes
-                for char in username:
-                    username_field.send_keys(char)
-                    time.sleep(0.1)
-                
-                for char in password:
-                    password_field.send_keys(char)
-                    time.sleep(0.1)
+                # Enter credentials
+                self._type_text(username_field, username, typing_delay)
+                self._type_text(password_field, password, typing_delay)
                 
-                # Find and verify login button is clickable
-                login_button = WebDriverWait(self.driver, 15).until(
-                    EC.element_to_be_clickable((By.CSS_SELECTOR, "button[type='submit']")),
-                    message="Login button not found or not clickable"
+                # Find login button; the JavaScript click below doesn't need
+                # Selenium's visibility/enabled checks
+                login_button = self._wait(field_timeout).until(
+                    self.EC_LOGIN_BUTTON,
+                    message="Login button not found"
                 )
                 
                 # Execute click with JavaScript for reliability
                 self.driver.execute_script("arguments[0].click();", login_button)
                 
-                # Wait for login to complete with multiple success conditions
-                WebDriverWait(self.driver, 30).until(
-                    lambda driver: any([
-                        EC.url_contains("account")(driver),
-                        EC.presence_of_element_located((By.CSS_SELECTOR, ".account-hub"))(driver),
-                        EC.presence_of_element_located((By.CSS_SELECTOR, ".logged-in"))(driver)
-                    ]),
+                # Wait for login to complete: account URL or a logged-in marker
+                self._wait(timeout).until(
+                    _logged_in,
                     message="Login verification failed"
                 )
                 
@@ -495,8 +943,8 @@ class StarCitizenCheckoutBot:
                     logger.error(f"Login failed after {max_retries} attempts. Last error: {str(e)}")
                     raise
                 
-                # Wait before retrying
-                time.sleep(5)
+                # Back off a little longer after each failure
+                time.sleep(retry_count)
                 
                 # Refresh the page for next attempt
                 try:
@@ -511,7 +959,7 @@ class StarCitizenCheckoutBot:
             self.driver.get(self.ship_url)
             
             # Wait for the page to load
-            self.wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, ".page-pledge")))
+            self.wait.until(self.EC_PAGE_PLEDGE)
             logger.info("Successfully loaded ship page")
             
         except Exception as e:
@@ -526,35 +974,21 @@ class StarCitizenCheckoutBot:
             bool: True if in stock, False otherwise
         """
         try:
-            # Check for common "out of stock" indicators
-            out_of_stock_indicators = [
-                ".out-of-stock",
-                ".sold-out",
-                ".stock-depleted",
-                ".unavailable"
-            ]
-            
-            # Look for any out of stock indicators
-            for indicator in out_of_stock_indicators:
-                try:
-                    element = self.driver.find_element(By.CSS_SELECTOR, indicator)
-                    logger.info("Ship is out of stock")
-                    return False
-                except NoSuchElementException:
-                    continue
+            # Look for any of the common "out of stock" indicators in one query
+            if self.driver.find_elements(*self.LOC_OUT_OF_STOCK):
+                logger.info("Ship is out of stock")
+                return False
             
             # Check if add to cart button is present and enabled
-            try:
-                add_to_cart_button = self.driver.find_element(By.CSS_SELECTOR, ".js-store-add-to-cart, .btn-add-to-cart")
-                if add_to_cart_button.is_enabled():
-                    logger.info("Ship appears to be in stock")
-                    return True
-                else:
-                    logger.info("Add to cart button is disabled - likely out of stock")
-                    return False
-            except NoSuchElementException:
+            add_to_cart_buttons = self.driver.find_elements(*self.LOC_ADD_TO_CART)
+            if not add_to_cart_buttons:
                 logger.info("Add to cart button not found - likely out of stock")
                 return False
+            if add_to_cart_buttons[0].is_enabled():
+                logger.info("Ship appears to be in stock")
+                return True
+            logger.info("Add to cart button is disabled - likely out of stock")
+            return False
             
         except Exception as e:
             logger.error(f"Error checking stock: {str(e)}")
@@ -563,49 +997,119 @@ class StarCitizenCheckoutBot:
     def select_ship_offer(self):
         """Select the appropriate ship offer (warbond or standard)."""
         try:
-            logger.info("Looking for ship offers...")
+            logger.info(f"Looking for {'Warbond' if self.warbond else 'standard'} offer...")
+            offer_locator = self.LOC_WARBOND_OFFER if self.warbond else self.LOC_STANDARD_OFFER
             
-            # Click 'View Offers' button if present
-            try:
-                view_offers = self.wait.until(
-                    EC.element_to_be_clickable((By.CSS_SELECTOR, ".js-view-offers, .view-offers-btn"))
-                )
-                view_offers.click()
-                logger.info("Clicked View Offers button")
-            except Exception as e:
-                logger.info("No View Offers button found, proceeding with visible offers")
-            
-            # Wait for offers to be visible
-            self.wait.until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, ".ship-offers, .pledge-options"))
+            status = self.driver.execute_script(
+                SELECT_OFFER_JS,
+                self.LOC_VIEW_OFFERS[1],
+                offer_locator[1],
+                self.timeout * 1000
             )
-            
-            # Look for the appropriate offer
-            if self.warbond:
-                logger.info("Looking for Warbond offer...")
-                offer_selector = "[data-warbond='true'], .warbond-offer"
-            else:
-                logger.info("Looking for standard offer...")
-                offer_selector = "[data-warbond='false'], .standard-offer"
-            
-            offer = self.wait.until(
-                EC.element_to_be_clickable((By.CSS_SELECTOR, offer_selector))
-            )
-            offer.click()
+            if status != 'ok':
+                raise TimeoutException("Ship offer not found")
             logger.info(f"Selected {'Warbond' if self.warbond else 'Standard'} offer")
             
         except Exception as e:
             logger.error(f"Failed to select ship offer: {str(e)}")
             raise
 
-    def add_to_cart(self, retry_attempts=None, retry_interval=5):
+    def _bootstrap_ship_page(self):
+        """
+        Open the ship page, select the offer and try to add it to the cart in one script.
+        
+        Returns:
+            bool: True if the ship was in stock and added to the cart, False
+                  if it still needs the add_to_cart retry loop
+        """
+        logger.info(f"Navigating to ship URL: {self.ship_url}")
+        self.driver.get(self.ship_url)
+        
+        offer_locator = self.LOC_WARBOND_OFFER if self.warbond else self.LOC_STANDARD_OFFER
+        result = self.driver.execute_script(
+            BOOTSTRAP_SHIP_JS,
+            self.LOC_PAGE_PLEDGE[1],
+            self.LOC_VIEW_OFFERS[1],
+            offer_locator[1],
+            self.LOC_OUT_OF_STOCK[1],
+            self.LOC_ADD_TO_CART[1],
+            self.timeout * 1000
+        )
+        if not result['offerSelected']:
+            raise TimeoutException("Ship page or offer not found")
+        logger.info(f"Selected {'Warbond' if self.warbond else 'Standard'} offer")
+        
+        if not result['inStock']:
+            logger.info("Ship not in stock yet")
+            return False
+        
+        try:
+            self.fast_wait.until(self.EC_CART_NOTIFICATION)
+        except TimeoutException:
+            logger.warning("Add to cart not confirmed, retrying")
+            return False
+        logger.info("Successfully added ship to cart")
+        return True
+    
+    def _build_stock_session(self):
+        """Create a requests session that carries the browser's cookies and user agent."""
+        import requests
+        from requests.adapters import HTTPAdapter
+        
+        # Every probe goes to the same host; keep that one connection alive
+        # so the TLS handshake is paid once rather than per attempt
+        session = requests.Session()
+        session.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=1))
+        for cookie in self.driver.get_cookies():
+            session.cookies.set(
+                cookie['name'],
+                cookie['value'],
+                domain=cookie.get('domain'),
+                path=cookie.get('path', '/')
+            )
+        session.headers['User-Agent'] = self.driver.execute_script("return navigator.userAgent")
+        return session
+    
+    def probe_stock(self):
+        """
+        Check stock through the JSON endpoint instead of reloading the page.
+        
+        Returns:
+            bool: Whether the endpoint reports the ship as available, or None
+                  if no endpoint is configured or the request failed
+        """
+        if not self.stock_url:
+            return None
+        try:
+            if self._stock_session is None:
+                self._stock_session = self._build_stock_session()
+            response = self._stock_session.get(self.stock_url, timeout=2)
+            response.raise_for_status()
+            return bool(response.json().get('available'))
+        except Exception as e:
+            logger.warning(f"Stock probe failed, falling back to page refresh: {str(e)}")
+            # Cookies may have rotated; rebuild the session next time
+            if self._stock_session is not None:
+                self._stock_session.close()
+                self._stock_session = None
+            return None
+    
+    def _refresh_ship_page(self):
+        """Reload the ship page and return as soon as the new page is up."""
+        old_root = self.driver.find_element(*self.LOC_HTML)
+        self.driver.refresh()
+        self.wait.until(EC.staleness_of(old_root))
+        self.wait.until(self.EC_PAGE_PLEDGE)
+    
+    def add_to_cart(self, retry_attempts=None, retry_interval=1):
         """
         Add the ship to the cart with optional retry functionality.
         
         Args:
             retry_attempts (int, optional): Number of times to retry if out of stock.
                                          If None, will retry indefinitely.
-            retry_interval (int): Seconds to wait between retries
+            retry_interval (int): Longest wait between retries; earlier retries
+                                  back off from a shorter delay
         
         Returns:
             bool: True if successfully added to cart, False if max retries reached
@@ -613,32 +1117,36 @@ class StarCitizenCheckoutBot:
         attempt = 1
         
         while True:
+            in_stock = False
             try:
-                logger.info(f"Attempt {attempt} to add ship to cart")
+                logger.debug(f"Attempt {attempt} to add ship to cart")
                 
-                # Refresh the page to get latest stock status
-                self.driver.refresh()
-                time.sleep(2)  # Wait for page to settle
+                in_stock = self.probe_stock()
+                if in_stock is None:
+                    # No usable endpoint; refresh the page to get latest stock status
+                    self._refresh_ship_page()
+                    in_stock = self.check_stock_available()
+                elif in_stock:
+                    # Only load the full page once the endpoint reports stock
+                    self.driver.get(self.ship_url)
                 
-                # Check if in stock
-                if not self.check_stock_available():
+                if not in_stock:
                     if retry_attempts and attempt >= retry_attempts:
                         logger.error("Maximum retry attempts reached - ship still not available")
                         return False
                     
-                    logger.info(f"Ship not in stock. Waiting {retry_interval} seconds before retry...")
-                    time.sleep(retry_interval)
+                    delay = _retry_delay(attempt, retry_interval)
+                    logger.debug(f"Ship not in stock. Waiting {delay:.2f} seconds before retry...")
+                    time.sleep(delay)
                     attempt += 1
                     continue
                 
                 # Try to add to cart
-                add_to_cart_button = self.wait.until(
-                    EC.element_to_be_clickable((By.CSS_SELECTOR, ".js-store-add-to-cart, .btn-add-to-cart"))
-                )
+                add_to_cart_button = self.fast_wait.until(self.EC_ADD_TO_CART_CLICKABLE)
                 add_to_cart_button.click()
                 
                 # Wait for confirmation that item was added to cart
-                self.wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, ".js-cart-notification, .notification-success")))
+                self.fast_wait.until(self.EC_CART_NOTIFICATION)
                 logger.info("Successfully added ship to cart")
                 return True
                 
@@ -654,8 +1162,11 @@ class StarCitizenCheckoutBot:
                     logger.error("Maximum retry attempts reached")
                     return False
             
-            logger.info(f"Waiting {retry_interval} seconds before retry...")
-            time.sleep(retry_interval)
+            # Stock was there but adding failed; retry almost immediately so
+            # the restock window isn't missed
+            delay = 0.1 if in_stock else _retry_delay(attempt, retry_interval)
+            logger.debug(f"Waiting {delay:.2f} seconds before retry...")
+            time.sleep(delay)
             attempt += 1
     
     def go_to_checkout(self):
@@ -667,13 +1178,11 @@ class StarCitizenCheckoutBot:
             self.driver.get("https://robertsspaceindustries.com/en/account/cart")
             
             # Wait for the checkout button
-            checkout_button = self.wait.until(
-                EC.element_to_be_clickable((By.CSS_SELECTOR, ".js-checkout-button, .btn-checkout"))
-            )
+            checkout_button = self.wait.until(self.EC_CHECKOUT_BUTTON_CLICKABLE)
             checkout_button.click()
             
             # Wait for checkout page to load
-            self.wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, ".checkout-step")))
+            self.wait.until(self.EC_CHECKOUT_STEP)
             logger.info("Successfully navigated to checkout page")
             
         except Exception as e:
@@ -691,18 +1200,16 @@ class StarCitizenCheckoutBot:
             logger.info(f"Attempting to apply coupon code: {coupon_code}")
             self.coupon_code = coupon_code
             
-            # Find and click "Apply Coupon" button or field
-            coupon_field = self.wait.until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, ".js-coupon-field, #coupon-code"))
-            )
-            coupon_field.send_keys(coupon_code)
-            
-            # Click apply button
-            apply_button = self.driver.find_element(By.CSS_SELECTOR, ".js-apply-coupon, .btn-apply-coupon")
-            apply_button.click()
+            # Find the coupon field and its apply button together
+            controls = self.wait.until(self._all_present(
+                field=self.LOC_COUPON_FIELD[1],
+                button=self.LOC_APPLY_COUPON[1]
+            ))
+            self._fast_fill(controls['field'], coupon_code)
+            controls['button'].click()
             
             # Wait for confirmation
-            self.wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, ".coupon-applied, .notification-success")))
+            self.wait.until(self.EC_COUPON_APPLIED)
             logger.info("Successfully applied coupon code")
             
         except Exception as e:
@@ -714,40 +1221,78 @@ class StarCitizenCheckoutBot:
         try:
             logger.info(f"Attempting to apply ${self.store_credit_amount} in store credit")
             
-            # Find store credit field
-            credit_field = self.wait.until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, ".js-store-credit-field, #store-credit"))
-            )
+            # Find the store credit field and its apply button together
+            controls = self.wait.until(self._all_present(
+                field=self.LOC_CREDIT_FIELD[1],
+                button=self.LOC_APPLY_CREDIT[1]
+            ))
             
-            # Clear the field and enter the credit amount
-            credit_field.clear()
-            credit_field.send_keys(str(self.store_credit_amount))
-            
-            # Click apply button
-            apply_button = self.driver.find_element(By.CSS_SELECTOR, ".js-apply-credit, .btn-apply-credit")
-            apply_button.click()
+            # Replace the field's contents with the credit amount
+            self._fast_fill(controls['field'], str(self.store_credit_amount))
+            controls['button'].click()
             
             # Wait for confirmation
-            self.wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, ".credit-applied, .notification-success")))
+            self.wait.until(self.EC_CREDIT_APPLIED)
             logger.info("Successfully applied store credit")
             
         except Exception as e:
             logger.error(f"Failed to apply store credit: {str(e)}")
             raise
     
+    def apply_discounts(self, coupon_code=None):
+        """
+        Apply the coupon code and store credit together in a single page script.
+        
+        Falls back to apply_coupon and apply_store_credit if the script can't
+        find the Step 1 form controls.
+        
+        Args:
+            coupon_code (str, optional): Coupon code to apply along with the store credit
+        """
+        try:
+            logger.info(f"Applying {'coupon code and ' if coupon_code else ''}${self.store_credit_amount} in store credit")
+            self.coupon_code = coupon_code or self.coupon_code
+            
+            # Wait for Step 1 to render before scripting against it
+            self.wait.until(self.EC_CREDIT_FIELD)
+            missing = self.driver.execute_script(
+                APPLY_DISCOUNTS_JS,
+                self.LOC_COUPON_FIELD[1],
+                self.LOC_APPLY_COUPON[1],
+                coupon_code,
+                self.LOC_CREDIT_FIELD[1],
+                self.LOC_APPLY_CREDIT[1],
+                str(self.store_credit_amount)
+            )
+            if missing:
+                logger.warning(f"Discount form controls not found ({', '.join(missing)}), applying one at a time")
+                if coupon_code:
+                    self.apply_coupon(coupon_code)
+                self.apply_store_credit()
+                return
+            
+            # One wait for both confirmations
+            if coupon_code:
+                self.wait.until(EC.all_of(self.EC_COUPON_APPLIED, self.EC_CREDIT_APPLIED))
+            else:
+                self.wait.until(self.EC_CREDIT_APPLIED)
+            logger.info("Successfully applied discounts")
+            
+        except Exception as e:
+            logger.error(f"Failed to apply discounts: {str(e)}")
+            raise
+    
     def proceed_to_payment(self):
         """Proceed to the payment options screen."""
         try:
             logger.info("Proceeding to payment options")
             
             # Click the "Proceed to Payment" button
-            payment_button = self.wait.until(
-                EC.element_to_be_clickable((By.CSS_SELECTOR, ".js-proceed-to-payment, .btn-proceed"))
-            )
+            payment_button = self.wait.until(self.EC_PROCEED_TO_PAYMENT_CLICKABLE)
             payment_button.click()
             
             # Wait for payment options to appear
-            self.wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, ".payment-methods, .payment-options")))
+            self.wait.until(self.EC_PAYMENT_OPTIONS)
             logger.info("Successfully reached payment options")
             
         except Exception as e:
@@ -760,27 +1305,19 @@ class StarCitizenCheckoutBot:
             logger.info("Handling disclaimer popup...")
             
             # Wait for disclaimer popup
-            disclaimer_dialog = self.wait.until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, ".disclaimer-dialog, #disclaimer-popup"))
-            )
+            disclaimer_dialog = self.wait.until(self.EC_DISCLAIMER_DIALOG)
             
-            # Scroll to bottom of disclaimer
+            # Scroll to bottom of disclaimer and check every unchecked
+            # agreement box inside it, in one call
             self.driver.execute_script(
-                "arguments[0].scrollTop = arguments[0].scrollHeight", 
-                disclaimer_dialog
+                "arguments[0].scrollTop = arguments[0].scrollHeight;"
+                "arguments[0].querySelectorAll(arguments[1]).forEach(box => box.click());",
+                disclaimer_dialog,
+                self.LOC_DISCLAIMER_CHECKBOXES[1]
             )
             
-            # Check the agreement boxes
-            checkboxes = self.driver.find_elements(By.CSS_SELECTOR, 
-                ".disclaimer-checkbox, input[type='checkbox']")
-            for checkbox in checkboxes:
-                if not checkbox.is_selected():
-                    checkbox.click()
-            
             # Click agree button
-            agree_button = self.wait.until(
-                EC.element_to_be_clickable((By.CSS_SELECTOR, ".js-agree-button, #agree-button"))
-            )
+            agree_button = self.wait.until(self.EC_AGREE_BUTTON_CLICKABLE)
             agree_button.click()
             
             logger.info("Successfully handled disclaimer")
@@ -789,7 +1326,7 @@ class StarCitizenCheckoutBot:
             logger.error(f"Failed to handle disclaimer: {str(e)}")
             raise
 
-    def complete_checkout(self, retry_attempts=None, retry_interval=5):
+    def complete_checkout(self, retry_attempts=None, retry_interval=1):
         """
         Run the complete checkout process.
         
@@ -804,54 +1341,43 @@ class StarCitizenCheckoutBot:
         try:
             logger.info("Starting checkout process")
             
-            # Navigate to ship page and select offer
-            self.navigate_to_ship()
-            self.select_ship_offer()
+            # Navigate to ship page and select offer, adding to cart straight
+            # away if the ship is already in stock
+            added = self._bootstrap_ship_page()
             
-            # Try to add to cart with retry functionality
-            cart_success = False
-            while not cart_success:
-                if not self.add_to_cart(retry_attempts=retry_attempts, retry_interval=retry_interval):
-                    logger.error("Failed to add ship to cart after all retry attempts")
-                    return False
-                
+            # Otherwise try to add to cart with retry functionality
+            if not added and not self.add_to_cart(retry_attempts=retry_attempts, retry_interval=retry_interval):
+                logger.error("Failed to add ship to cart after all retry attempts")
+                return False
+            
+            # The ship is in the cart now, so only the checkout step is retried
+            for checkout_try in range(1, self.max_checkout_retries + 1):
                 try:
-                    # Try to proceed with checkout
                     self.go_to_checkout()
-                    cart_success = True
+                    break
                 except Exception as e:
-                    logger.warning(f"Checkout failed, retrying: {str(e)}")
-                    continue
-                logger.error("Failed to add ship to cart after all retry attempts")
+                    logger.warning(f"Checkout attempt {checkout_try} failed: {str(e)}")
+            else:
+                logger.error(f"Could not reach checkout after {self.max_checkout_retries} attempts")
                 return False
             
             # Handle Step 1: Apply coupon and store credit
-            if self.coupon_code:
-                self.apply_coupon(self.coupon_code)
-            self.apply_store_credit()
+            self.apply_discounts(self.coupon_code)
             
             # Click continue to Step 2
-            continue_button = self.wait.until(
-                EC.element_to_be_clickable((By.CSS_SELECTOR, ".js-continue, .continue-btn"))
-            )
+            continue_button = self.wait.until(self.EC_CONTINUE_CLICKABLE)
             continue_button.click()
             
             # Handle Step 2: Confirm address and handle disclaimer
-            self.wait.until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, ".address-step, #shipping-step"))
-            )
-            proceed_button = self.wait.until(
-                EC.element_to_be_clickable((By.CSS_SELECTOR, ".js-proceed-pay, .proceed-to-pay"))
-            )
+            self.wait.until(self.EC_ADDRESS_STEP)
+            proceed_button = self.wait.until(self.EC_PROCEED_PAY_CLICKABLE)
             proceed_button.click()
             
             # Handle the disclaimer popup
             self.handle_disclaimer()
             
             # Wait for Step 3 (payment screen)
-            self.wait.until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, ".payment-step, #payment-step"))
-            )
+            self.wait.until(self.EC_PAYMENT_STEP)
             
             logger.info("Checkout process completed successfully")
             return True
@@ -862,10 +1388,71 @@ class StarCitizenCheckoutBot:
     
     def close(self):
         """Close the browser."""
+        if self._stock_session is not None:
+            self._stock_session.close()
+            self._stock_session = None
         if self.driver:
             self.driver.quit()
             logger.info("Browser closed")
 
+class ParallelStockWatcher:
+    """Poll the ship page from several bots at once and pick the first to see stock."""
+    
+    def __init__(self, bots, poll_interval=1):
+        """
+        Initialize the watcher.
+        
+        Args:
+            bots (list): StarCitizenCheckoutBot instances, each with its own browser
+            poll_interval (float): Seconds each bot waits between stock checks
+        """
+        self.bots = bots
+        self.poll_interval = poll_interval
+        self._stock_found = threading.Event()
+    
+    def _watch(self, bot):
+        """Poll one bot until it sees stock or another bot wins."""
+        bot.navigate_to_ship()
+        while not self._stock_found.is_set():
+            if bot.check_stock_available():
+                self._stock_found.set()
+                return bot
+            if self._stock_found.wait(self.poll_interval):
+                break
+            bot.driver.refresh()
+        return None
+    
+    def wait_for_stock(self, timeout=None):
+        """
+        Watch for stock from all bots concurrently.
+        
+        Args:
+            timeout (float, optional): Maximum seconds to wait; None waits forever
+        
+        Returns:
+            StarCitizenCheckoutBot: The first bot that saw the ship in stock, or
+                                    None if none did before the timeout
+        """
+        self._stock_found.clear()
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(self.bots)) as executor:
+            futures = [executor.submit(self._watch, bot) for bot in self.bots]
+            try:
+                for future in concurrent.futures.as_completed(futures, timeout=timeout):
+                    try:
+                        bot = future.result()
+                    except Exception as e:
+                        logger.warning(f"Stock watcher failed: {str(e)}")
+                        continue
+                    if bot is not None:
+                        logger.info("Stock detected, handing off to checkout")
+                        return bot
+            except concurrent.futures.TimeoutError:
+                logger.warning(f"No stock detected within {timeout} seconds")
+            finally:
+                # Stop any watchers that are still polling
+                self._stock_found.set()
+        return None
+
 def main():
     """Main function to run the checkout bot."""
     import argparse
@@ -877,15 +1464,19 @@ def main():
     parser.add_argument("--coupon", help="20% off coupon code")
     parser.add_argument("--browser", default="chrome", choices=["chrome", "firefox", "safari"], help="Browser to use")
     parser.add_argument("--headless", action="store_true", help="Run browser in headless mode (not supported in Safari)")
+    parser.add_argument("--block-images", action="store_true", help="Don't load images (Chrome only)")
+    parser.add_argument("--stock-url", help="JSON endpoint with an 'available' field to poll instead of reloading the ship page")
     parser.add_argument("--use-existing-browser", action="store_true", default=True, help="Connect to existing Chrome instance (maintains login)")
     parser.add_argument("--new-window", action="store_true", help="Launch in a new browser window instead of connecting to existing")
     parser.add_argument("--use-config", action="store_true", help="Use saved configuration")
     parser.add_argument("--setup-config", action="store_true", help="Setup and save configuration")
     parser.add_argument("--retry-attempts", type=int, help="Number of times to retry if ship is out of stock. If not provided, will retry indefinitely.")
-    parser.add_argument("--retry-interval", type=int, default=5, help="Seconds to wait between retries (default: 5)")
+    parser.add_argument("--retry-interval", type=float, default=1, help="Seconds to wait between retries (default: 1)")
+    parser.add_argument("--fast-poll", action="store_true", help="Poll every 0.5 seconds to catch short sale windows; pair with --stock-url to avoid page reloads")
     parser.add_argument("--ship-url", help="URL of the ship to purchase (defaults to Idris-P)")
     parser.add_argument("--warbond", action="store_true", help="Select warbond version instead of standard")
     parser.add_argument("--store-credit", type=float, default=1385, help="Amount of store credit to apply (default: 1385)")
+    parser.add_argument("--watchers", type=int, default=1, help="Chrome instances polling for stock in parallel (default: 1)")
     
     args = parser.parse_args()
     
@@ -896,9 +1487,15 @@ def main():
     browser = args.browser
     
     # Check if we should use the configuration manager
+    if args.setup_config or args.use_config:
+        try:
+            import config_manager
+        except ImportError:
+            logger.error("Config manager not found. config_manager.py must be next to bot.py to use --setup-config or --use-config")
+            return
+    
     if args.setup_config:
-        from config_manager import setup_config
-        if setup_config():
+        if config_manager.setup_config():
             logger.info("Configuration saved successfully. You can now use --use-config")
             return
         else:
@@ -907,8 +1504,7 @@ def main():
     
     if args.use_config:
         try:
-            from config_manager import ConfigManager
-            config = ConfigManager()
+            config = config_manager.ConfigManager()
             
             # Get encryption password
             encryption_password = getpass.getpass("Enter your encryption password: ")
@@ -933,13 +1529,15 @@ def main():
             
             logger.info("Successfully loaded configuration")
             
-        except ImportError:
-            logger.error("Config manager not found. Please create a configuration first with --setup-config")
-            return
         except Exception as e:
             logger.error(f"Error loading configuration: {str(e)}")
             return
     
+    if args.fast_poll:
+        args.retry_interval = FAST_POLL_INTERVAL
+        if not args.stock_url:
+            logger.warning("--fast-poll without --stock-url reloads the ship page on every check")
+    
     # Validate required arguments
     if not username or not password or not coupon_code:
         logger.error("Missing required arguments. Provide credentials and coupon directly or use --use-config")
@@ -951,11 +1549,44 @@ def main():
         headless=args.headless,
         ship_url=args.ship_url,
         warbond=args.warbond,
-        store_credit_amount=args.store_credit
+        store_credit_amount=args.store_credit,
+        block_images=args.block_images,
+        stock_url=args.stock_url
     )
     
     try:
         bot.login(username, password)
+        
+        if args.watchers > 1 and browser == 'chrome':
+            # Each extra watcher drives its own debug-mode Chrome
+            bots = [bot]
+            for i in range(1, args.watchers):
+                watcher_bot = StarCitizenCheckoutBot(
+                    browser=browser,
+                    headless=args.headless,
+                    ship_url=args.ship_url,
+                    warbond=args.warbond,
+                    store_credit_amount=args.store_credit,
+                    use_existing_browser=True,
+                    debug_port=9222 + i,
+                    debug_user_data_dir=f'remote-profile-{i}',
+                    block_images=args.block_images,
+                    stock_url=args.stock_url
+                )
+                watcher_bot.login(username, password)
+                bots.append(watcher_bot)
+            
+            winner = ParallelStockWatcher(bots, poll_interval=args.retry_interval).wait_for_stock()
+            for other in bots:
+                if other is not winner:
+                    other.close()
+            if winner is None:
+                logger.error("No watcher saw the ship in stock")
+                return
+            bot = winner
+        elif args.watchers > 1:
+            logger.warning("Parallel stock watchers are only supported with Chrome")
+        
         bot.coupon_code = coupon_code
         success = bot.complete_checkout(
             retry_attempts=args.retry_attempts,
@@ -970,9 +1601,14 @@ def main():
         logger.info("Bot has reached the payment screen. DO NOT CLOSE THIS WINDOW.")
         logger.info("Please complete the payment process manually.")
         
-        # Wait indefinitely for user to complete the process
-        while True:
-            time.sleep(60)
+        # Wait indefinitely for user to complete the process. Windows has no
+        # signal.pause(), so poll there with a sleep Ctrl+C can interrupt
+        if hasattr(signal, "pause"):
+            while True:
+                signal.pause()
+        else:
+            while True:
+                time.sleep(1)
             
     except KeyboardInterrupt:
         logger.info("Bot stopped by user")
@@ -139,24 +139,15 @@ IF %ERRORLEVEL% NEQ 0 (
 )
 ECHO ✓ Selenium verified
 
-REM Test WebDriver Manager
-python -c "from webdriver_manager.chrome import ChromeDriverManager; ChromeDriverManager().install()" >nul 2>&1
-IF %ERRORLEVEL% NEQ 0 (
-    ECHO X WebDriver Manager verification failed
-    ECHO Please try:
-    ECHO 1. Run setup.bat as administrator
-    ECHO 2. Check your internet connection
-    ECHO 3. Temporarily disable antivirus
-    EXIT /B 1
-)
-ECHO ✓ WebDriver Manager verified
-
 REM Verify browser setup
 ECHO Testing browser configuration...
-python -c "from selenium import webdriver; from selenium.webdriver.chrome.service import Service; from webdriver_manager.chrome import ChromeDriverManager; print('Setting up Chrome...'); driver = webdriver.Chrome(service=Service(ChromeDriverManager().install())); print('Chrome launched successfully'); driver.quit(); print('Chrome test complete')"
+REM Selenium Manager downloads a matching chromedriver on first launch
+python -c "from selenium import webdriver; print('Setting up Chrome...'); driver = webdriver.Chrome(); print('Chrome launched successfully'); driver.quit(); print('Chrome test complete')"
 IF %ERRORLEVEL% NEQ 0 (
     ECHO X Browser setup verification failed.
     ECHO Please ensure Chrome is installed and up to date.
+    ECHO If it is, check your internet connection and temporarily disable antivirus
+    ECHO so Selenium Manager can download chromedriver.
     PAUSE
     EXIT /B 1
 )
@@ -116,38 +116,9 @@ if [ $? -ne 0 ]; then
 fi
 echo "✓ Selenium verified"
 
-# Download WebDriver
-echo "Do you want to download ChromeDriver? (y/n)"
-read -r download_driver
-if [[ "$download_driver" =~ ^[Yy]$ ]]; then
-    echo "Installing webdriver-manager..."
-    pip install webdriver-manager
-    echo "Creating helper script to download driver automatically..."
-    cat > download_driver.py << 'EOF'
-from webdriver_manager.chrome import ChromeDriverManager
-from webdriver_manager.firefox import GeckoDriverManager
-import sys
-
-print("Downloading WebDriver...")
-try:
-    if len(sys.argv) > 1 and sys.argv[1].lower() == "firefox":
-        driver_path = GeckoDriverManager().install()
-        print(f"Firefox WebDriver downloaded to: {driver_path}")
-    else:
-        driver_path = ChromeDriverManager().install()
-        print(f"Chrome WebDriver downloaded to: {driver_path}")
-    print("✓ WebDriver downloaded successfully")
-except Exception as e:
-    print(f"✗ Error downloading WebDriver: {str(e)}")
-EOF
-    
-    echo "Downloading Chrome WebDriver..."
-    python download_driver.py
-    echo "✓ Setup complete with WebDriver"
-else
-    echo "Skipping WebDriver download. You will need to download it manually."
-    echo "✓ Setup complete without WebDriver"
-fi
+# Selenium Manager, bundled with Selenium, downloads a matching driver on
+# the first browser launch, so there is no separate driver download step
+echo "✓ WebDriver will be set up by Selenium Manager on first run"
 
 echo ""
 echo "==== SETUP COMPLETE ===="
@@ -1,3 +1,5 @@
+import functools
+import subprocess
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service as ChromeService
 from selenium.webdriver.firefox.service import Service as FirefoxService
@@ -9,6 +11,36 @@ from .logging import get_logger
 
 logger = get_logger(__name__)
 
+# Requests the checkout flow never needs
+BLOCKED_MEDIA_URLS = [
+    "*.jpg", "*.jpeg", "*.png", "*.webp", "*.mp4",
+    "*.woff", "*.woff2",
+    "*google-analytics*", "*optimizely*", "*doubleclick*",
+]
+
+@functools.lru_cache(maxsize=None)
+def _resolve_driver_path(browser_type: str) -> str:
+    """Resolve the driver binary for a browser once per process."""
+    if browser_type == "chrome":
+        return ChromeDriverManager().install()
+    return GeckoDriverManager().install()
+
+def launch_persistent_chrome(
+    port: int = 9222,
+    user_data_dir: str = "persistent-profile",
+    chrome_binary: str = "google-chrome",
+) -> subprocess.Popen:
+    """Start a long-lived Chrome that later runs can attach to via attach_debug_port."""
+    process = subprocess.Popen([
+        chrome_binary,
+        f"--remote-debugging-port={port}",
+        f"--user-data-dir={user_data_dir}",
+        "--no-first-run",
+        "--no-default-browser-check",
+    ])
+    logger.info("Persistent Chrome launched", port=port, user_data_dir=user_data_dir)
+    return process
+
 class BrowserFactory:
     """Factory for creating WebDriver instances with proper configuration."""
     
@@ -27,6 +59,32 @@ class BrowserFactory:
         """Create and configure Chrome WebDriver."""
         options = webdriver.ChromeOptions()
         
+        if config.attach_debug_port:
+            # Reuse a running Chrome; its flags and profile are already set
+            options.add_experimental_option("debuggerAddress", f"127.0.0.1:{config.attach_debug_port}")
+        else:
+            BrowserFactory._add_chrome_launch_options(options, config)
+
+        service = ChromeService(config.driver_path or _resolve_driver_path("chrome"))
+        driver = webdriver.Chrome(service=service, options=options)
+        
+        if config.block_media:
+            try:
+                driver.execute_cdp_cmd("Network.enable", {})
+                driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_MEDIA_URLS})
+            except Exception as e:
+                logger.warning("Could not block media requests", error=str(e))
+        
+        logger.info(
+            "Chrome WebDriver created",
+            mode=config.mode.value,
+            attached_port=config.attach_debug_port,
+        )
+        return driver
+
+    @staticmethod
+    def _add_chrome_launch_options(options: webdriver.ChromeOptions, config: BrowserConfig) -> None:
+        """Add the flags used when the driver starts its own Chrome."""
         if config.mode == BrowserMode.HEADLESS:
             options.add_argument("--headless=new")
         
@@ -39,12 +97,6 @@ class BrowserFactory:
         if config.profile_path:
             options.add_argument(f"user-data-dir={config.profile_path}")
 
-        service = ChromeService(ChromeDriverManager().install())
-        driver = webdriver.Chrome(service=service, options=options)
-        
-        logger.info("Chrome WebDriver created", mode=config.mode.value)
-        return driver
-
     @staticmethod
     def _create_firefox_driver(config: BrowserConfig) -> webdriver.Firefox:
         """Create and configure Firefox WebDriver."""
@@ -57,7 +109,7 @@ class BrowserFactory:
             options.add_argument("-profile")
             options.add_argument(config.profile_path)
 
-        service = FirefoxService(GeckoDriverManager().install())
+        service = FirefoxService(config.driver_path or _resolve_driver_path("firefox"))
         driver = webdriver.Firefox(service=service, options=options)
         
         logger.info("Firefox WebDriver created", mode=config.mode.value)
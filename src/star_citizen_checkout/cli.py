@@ -2,23 +2,29 @@ import argparse
 import json
 import sys
 from pathlib import Path
-from typing import Optional, Dict, Any, List
-from selenium import webdriver
+from typing import TYPE_CHECKING, Optional, Dict, Any, List
 from .config import Config, BrowserMode, RetryConfig, BrowserConfig
 from .logging import setup_logging, get_logger
-from .browser import BrowserFactory
 from .shutdown import ShutdownManager
+
+if TYPE_CHECKING:
+    from selenium import webdriver
+
+# Retry interval used by --fast-poll
+FAST_POLL_INTERVAL = 0.5
+
 class CheckoutCLI:
     def __init__(self):
         self.logger = get_logger(__name__)
         self.parser = self._create_parser()
         self.config: Optional[Config] = None
-        self.driver: Optional[webdriver.Remote] = None
+        self.driver: Optional["webdriver.Remote"] = None
         self.shutdown_manager = ShutdownManager()
     def _create_parser(self) -> argparse.ArgumentParser:
         parser = argparse.ArgumentParser(
             description="Star Citizen Checkout Bot CLI",
-            formatter_class=argparse.ArgumentDefaultsHelpFormatter
+            formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+            allow_abbrev=False
         )
         
         parser.add_argument(
@@ -43,8 +49,14 @@ class CheckoutCLI:
         parser.add_argument(
             "--retry-interval",
             type=float,
-            default=5.0,
-            help="Interval between retry attempts in seconds"
+            default=None,
+            help="Interval between retry attempts in seconds (falls back to the config file, then 5.0)"
+        )
+        
+        parser.add_argument(
+            "--fast-poll",
+            action="store_true",
+            help="Poll every 0.5 seconds to catch short sale windows"
         )
         
         parser.add_argument(
@@ -54,6 +66,13 @@ class CheckoutCLI:
             help="Maximum number of retry attempts"
         )
         
+        parser.add_argument(
+            "--events-file",
+            type=str,
+            default=None,
+            help="Append each retry event to this JSON-Lines file (falls back to the config file, then off)"
+        )
+        
         parser.add_argument(
             "--browser-mode",
             choices=["headless", "headed"],
@@ -80,17 +99,32 @@ class CheckoutCLI:
         config_data = self._load_config_file(args.config)
         
         # Create retry config with values from file, overridden by command line
+        max_interval = config_data.get("retry", {}).get("max_interval", 10.0)
+        if args.fast_poll:
+            base_interval = FAST_POLL_INTERVAL
+            # Backoff would otherwise stretch the polling back out to max_interval
+            max_interval = min(max_interval, FAST_POLL_INTERVAL)
+        elif args.retry_interval is not None:
+            base_interval = args.retry_interval
+        else:
+            base_interval = config_data.get("retry", {}).get("base_interval", 5.0)
         retry_config = RetryConfig(
-            base_interval=args.retry_interval,
+            base_interval=base_interval,
+            max_interval=max_interval,
+            backoff_factor=config_data.get("retry", {}).get("backoff_factor", 3.0),
             max_retries=config_data.get("retry", {}).get("max_retries", 100),
-            max_attempts_per_minute=config_data.get("retry", {}).get("max_attempts_per_minute", 10)
+            max_attempts_per_minute=config_data.get("retry", {}).get("max_attempts_per_minute", 10),
+            events_file=args.events_file or config_data.get("retry", {}).get("events_file", None)
         )
 
         # Create browser config with values from file, overridden by command line
         browser_config = BrowserConfig(
             mode=args.browser_mode,
             browser_type=config_data.get("browser", {}).get("browser_type", "chrome"),
-            profile_path=config_data.get("browser", {}).get("profile_path", None)
+            profile_path=config_data.get("browser", {}).get("profile_path", None),
+            driver_path=config_data.get("browser", {}).get("driver_path", None),
+            block_media=config_data.get("browser", {}).get("block_media", True),
+            attach_debug_port=config_data.get("browser", {}).get("attach_debug_port", None)
         )
 
         # Build final config
@@ -106,6 +140,7 @@ class CheckoutCLI:
         try:
             args = self.parser.parse_args(test_args)
             self.config = self._create_config(args)
+            setup_logging(self.config.log_level, self.config.debug)
             
             if args.command == "start":
                 return self._handle_start(args)
@@ -129,6 +164,9 @@ class CheckoutCLI:
                 self.logger.error("No configuration available")
                 return 1
                 
+            # Selenium and the driver managers are only needed to start a browser
+            from .browser import BrowserFactory
+            
             # Create and register browser
             self.driver = BrowserFactory.create_driver(self.config.browser)
             self.shutdown_manager.register_browser(self.driver)
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional
 from enum import Enum
 
@@ -8,18 +8,27 @@ class BrowserMode(str, Enum):
 
 class RetryConfig(BaseModel):
     """Configuration for retry behavior."""
+    model_config = ConfigDict(frozen=True, extra="forbid")
     base_interval: float = Field(default=5.0, description="Base interval between retries in seconds")
+    max_interval: float = Field(default=10.0, description="Upper bound on the backoff between retries in seconds")
+    backoff_factor: float = Field(default=3.0, description="Growth factor applied to the previous backoff")
     max_retries: int = Field(default=100, description="Maximum number of retry attempts")
     max_attempts_per_minute: int = Field(default=10, description="Rate limiting: max attempts per minute")
+    events_file: Optional[str] = Field(default=None, description="Append each retry event to this JSON-Lines file; off when unset")
 
 class BrowserConfig(BaseModel):
     """Browser-specific configuration."""
+    model_config = ConfigDict(frozen=True, extra="forbid")
     mode: BrowserMode = Field(default=BrowserMode.HEADLESS, description="Browser mode (headless/headed)")
     browser_type: str = Field(default="chrome", description="Browser type (chrome/firefox)")
     profile_path: Optional[str] = Field(default=None, description="Path to browser profile if using one")
+    driver_path: Optional[str] = Field(default=None, description="Path to a driver binary; skips driver resolution when set")
+    block_media: bool = Field(default=True, description="Block images, fonts, video and analytics requests (Chrome only)")
+    attach_debug_port: Optional[int] = Field(default=None, description="Attach to a Chrome already listening on this remote debugging port (Chrome only)")
 
 class Config(BaseModel):
     """Main configuration class."""
+    model_config = ConfigDict(frozen=True, extra="forbid")
     retry: RetryConfig = Field(default_factory=RetryConfig)
     browser: BrowserConfig = Field(default_factory=BrowserConfig)
     log_level: str = Field(default="INFO", description="Logging level")
@@ -1,7 +1,7 @@
 """Error recovery and handling system with progressive recovery strategies."""
 
 from enum import Enum, auto
-from typing import Optional, Dict, Any, Callable
+from typing import Optional, Dict, Any, Callable, Tuple
 import time
 import logging
 from selenium.webdriver.remote.webdriver import WebDriver
@@ -33,7 +33,7 @@ class ErrorClassification(Enum):
 class ErrorRecoveryManager:
     """Manages error recovery with progressive strategies."""
 
-    # Error classification mappings
+    # Error classification mappings, most specific first; subclasses match too
     ERROR_CLASSIFICATIONS = {
         TimeoutException: ErrorClassification.NETWORK,
         NoSuchElementException: ErrorClassification.STRUCTURAL,
@@ -49,36 +49,60 @@ class ErrorRecoveryManager:
         RecoveryLevel.RESTART_RETRY: 30,
     }
 
-    def __init__(self, driver: WebDriver, restart_callback: Optional[Callable] = None):
+    # Attempts allowed at each level before escalating
+    _MAX_ATTEMPTS = {
+        RecoveryLevel.WAIT_RETRY: 3,
+        RecoveryLevel.REFRESH_RETRY: 2,
+        RecoveryLevel.RESTART_RETRY: 1,
+    }
+
+    # Level to escalate to once the current one is exhausted
+    _NEXT_LEVEL = {
+        RecoveryLevel.WAIT_RETRY: RecoveryLevel.REFRESH_RETRY,
+        RecoveryLevel.REFRESH_RETRY: RecoveryLevel.RESTART_RETRY,
+        RecoveryLevel.RESTART_RETRY: RecoveryLevel.USER_INTERVENTION,
+    }
+
+    def __init__(self, driver: WebDriver, restart_callback: Optional[Callable] = None,
+                 on_page_change: Optional[Callable] = None):
         """Initialize the recovery manager.
         
         Args:
             driver: Selenium WebDriver instance
             restart_callback: Optional callback for browser restart
+            on_page_change: Optional callback run after a refresh or restart
         """
         self.driver = driver
         self.restart_callback = restart_callback
-        self.recovery_attempts = {level: 0 for level in RecoveryLevel}
-        self.error_counts: Dict[ErrorClassification, int] = {
-            classification: 0 for classification in ErrorClassification
-        }
+        self.on_page_change = on_page_change
+        self.recovery_attempts = dict.fromkeys(RecoveryLevel, 0)
+        self.error_counts: Dict[ErrorClassification, int] = dict.fromkeys(ErrorClassification, 0)
         self.recovery_start_time = 0.0
         self.current_level = RecoveryLevel.WAIT_RETRY
+        # Most recently classified error type; the same error tends to repeat
+        self._last_cls: Tuple[type, ErrorClassification] = (type(None), ErrorClassification.FATAL)
 
     def classify_error(self, error: Exception) -> ErrorClassification:
         """Classify an error for appropriate handling."""
         error_type = type(error)
-        return self.ERROR_CLASSIFICATIONS.get(error_type, ErrorClassification.FATAL)
+        if error_type is self._last_cls[0]:
+            return self._last_cls[1]
+        classification = ErrorClassification.FATAL
+        for exc_type, exc_classification in self.ERROR_CLASSIFICATIONS.items():
+            if isinstance(error, exc_type):
+                classification = exc_classification
+                break
+        self._last_cls = (error_type, classification)
+        return classification
 
     def should_escalate(self) -> bool:
         """Determine if recovery should escalate to next level."""
-        MAX_ATTEMPTS = {
-            RecoveryLevel.WAIT_RETRY: 3,
-            RecoveryLevel.REFRESH_RETRY: 2,
-            RecoveryLevel.RESTART_RETRY: 1,
-        }
-        return (self.current_level in MAX_ATTEMPTS and 
-                self.recovery_attempts[self.current_level] >= MAX_ATTEMPTS[self.current_level])
+        return self.recovery_attempts[self.current_level] >= self._MAX_ATTEMPTS.get(self.current_level, float('inf'))
+
+    def _notify_page_change(self) -> None:
+        """Let the owner drop anything cached about the previous page."""
+        if self.on_page_change:
+            self.on_page_change()
 
     def execute_recovery(self, error: Exception) -> bool:
         """Execute recovery strategy for the given error.
@@ -93,7 +117,7 @@ class ErrorRecoveryManager:
             Exception: If recovery escalates to user intervention
         """
         if not self.recovery_start_time:
-            self.recovery_start_time = time.time()
+            self.recovery_start_time = time.monotonic()
 
         error_class = self.classify_error(error)
         self.error_counts[error_class] += 1
@@ -107,7 +131,7 @@ class ErrorRecoveryManager:
                 "classification": error_class.name,
                 "recovery_level": self.current_level.name,
                 "attempt": self.recovery_attempts[self.current_level] + 1,
-                "time_in_recovery": time.time() - self.recovery_start_time
+                "time_in_recovery": time.monotonic() - self.recovery_start_time
             }
         )
 
@@ -122,18 +146,20 @@ class ErrorRecoveryManager:
             elif self.current_level == RecoveryLevel.REFRESH_RETRY:
                 time.sleep(self.RECOVERY_DELAYS[RecoveryLevel.REFRESH_RETRY])
                 self.driver.refresh()
+                self._notify_page_change()
                 success = True
 
             elif self.current_level == RecoveryLevel.RESTART_RETRY:
                 time.sleep(self.RECOVERY_DELAYS[RecoveryLevel.RESTART_RETRY])
                 if self.restart_callback:
                     self.restart_callback()
+                    self._notify_page_change()
                     success = True
 
             elif self.current_level == RecoveryLevel.USER_INTERVENTION:
                 msg = "Recovery escalated to user intervention. "
                 msg += f"Error counts: {self.error_counts}, "
-                msg += f"Time in recovery: {time.time() - self.recovery_start_time:.1f}s"
+                msg += f"Time in recovery: {time.monotonic() - self.recovery_start_time:.1f}s"
                 raise Exception(msg)
 
         finally:
@@ -141,10 +167,9 @@ class ErrorRecoveryManager:
             
             # Check if we should escalate to next level
             if self.should_escalate():
-                next_levels = list(RecoveryLevel)
-                current_idx = next_levels.index(self.current_level)
-                if current_idx + 1 < len(next_levels):
-                    self.current_level = next_levels[current_idx + 1]
+                next_level = self._NEXT_LEVEL.get(self.current_level)
+                if next_level:
+                    self.current_level = next_level
                     logger.warning(
                         f"Escalating recovery to {self.current_level.name}",
                         extra={"error_counts": self.error_counts}
@@ -154,7 +179,7 @@ class ErrorRecoveryManager:
 
     def reset(self):
         """Reset recovery state for new attempts."""
-        self.recovery_attempts = {level: 0 for level in RecoveryLevel}
-        self.error_counts = {classification: 0 for classification in ErrorClassification}
+        self.recovery_attempts = dict.fromkeys(RecoveryLevel, 0)
+        self.error_counts = dict.fromkeys(ErrorClassification, 0)
         self.recovery_start_time = 0.0
         self.current_level = RecoveryLevel.WAIT_RETRY
@@ -1,13 +1,63 @@
+import atexit
+import logging
+import logging.handlers
+import queue
 import sys
 import structlog
-from typing import Optional
+from structlog.typing import Processor
+from types import ModuleType
+from typing import Any, Callable, List, Optional
 from datetime import datetime
 
+orjson: Optional[ModuleType]
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None
+
+def _orjson_dumps(value: Any, default: Optional[Callable[[Any], Any]] = None, **kwargs: Any) -> str:
+    """Serialize a log event with orjson for structlog's JSONRenderer."""
+    assert orjson is not None  # Only installed as the serializer when orjson imported
+    data: bytes = orjson.dumps(value, default=default)
+    return data.decode()
+
+# Records waiting for the background writer; new records are dropped when full
+LOG_QUEUE_SIZE = 10000
+
+_queue_handler: Optional[logging.Handler] = None
+_listener: Optional[logging.handlers.QueueListener] = None
+
+class _DeferredQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler that leaves formatting to the listener thread."""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # The queue never leaves the process, so the record (and the
+        # structlog event dict it carries) can be handed over unformatted.
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            pass  # Never block the checkout loop on log output
+
+def _stop_listener() -> None:
+    """Stop the background writer, flushing queued records."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
 def setup_logging(log_level: str = "INFO", debug: bool = False) -> None:
-    """Configure structured logging for the application."""
+    """Configure structured logging for the application.
+    
+    Log calls only enqueue the event; rendering and writing to stderr happen
+    on a background listener thread.
+    """
+    global _queue_handler, _listener
     
     # Configure processors
-    processors = [
+    processors: List[Processor] = [
         structlog.stdlib.add_log_level,
         structlog.stdlib.add_logger_name,
         structlog.processors.TimeStamper(fmt="iso"),
@@ -15,15 +65,35 @@ def setup_logging(log_level: str = "INFO", debug: bool = False) -> None:
         structlog.processors.format_exc_info,
     ]
 
+    renderer: Processor
     if debug:
         # Pretty printing for development
-        processors.append(structlog.dev.ConsoleRenderer())
+        renderer = structlog.dev.ConsoleRenderer()
     else:
         # JSON formatting for production
-        processors.append(structlog.processors.JSONRenderer())
+        if orjson is not None:
+            renderer = structlog.processors.JSONRenderer(serializer=_orjson_dumps)
+        else:
+            renderer = structlog.processors.JSONRenderer()
+
+    stderr_handler = logging.StreamHandler(sys.stderr)
+    stderr_handler.setFormatter(structlog.stdlib.ProcessorFormatter(
+        processor=renderer,
+        foreign_pre_chain=processors,
+    ))
+
+    root = logging.getLogger()
+    _stop_listener()
+    if _queue_handler is not None:
+        root.removeHandler(_queue_handler)
+    _queue_handler = _DeferredQueueHandler(queue.Queue(maxsize=LOG_QUEUE_SIZE))
+    root.addHandler(_queue_handler)
+    root.setLevel(log_level.upper())
+    _listener = logging.handlers.QueueListener(_queue_handler.queue, stderr_handler)
+    _listener.start()
 
     structlog.configure(
-        processors=processors,
+        processors=processors + [structlog.stdlib.ProcessorFormatter.wrap_for_formatter],
         wrapper_class=structlog.stdlib.BoundLogger,
         logger_factory=structlog.stdlib.LoggerFactory(),
         cache_logger_on_first_use=True,
@@ -33,5 +103,7 @@ def get_logger(name: Optional[str] = None) -> structlog.BoundLogger:
     """Get a configured logger instance."""
     return structlog.get_logger(name)
 
+atexit.register(_stop_listener)
+
 # Create default logger
 logger = get_logger(__name__)
@@ -1,12 +1,33 @@
+from collections import Counter, deque
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, List, Optional
+from types import ModuleType
+from typing import Any, Counter as CounterType, Deque, Dict, Optional
+import atexit
 import json
 import logging
-import os
 from pathlib import Path
+import threading
 import time
 
+orjson: Optional[ModuleType]
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None
+
+# Metrics are written when this much time has passed since the last write
+# or this many changes are pending; a background thread picks up the rest.
+FLUSH_INTERVAL = 0.5
+FLUSH_MAX_PENDING = 16
+BACKGROUND_FLUSH_INTERVAL = 1.0
+
+# Minimum time between status lines printed to the console.
+NOTIFY_INTERVAL = 1.0
+
+# Number of recent response times kept in memory.
+RESPONSE_TIME_WINDOW = 1024
+
 @dataclass
 class MetricsData:
     """Stores monitoring metrics data."""
@@ -14,72 +35,148 @@ class MetricsData:
     total_attempts: int = 0
     successful_attempts: int = 0
     failed_attempts: int = 0
-    response_times: List[float] = field(default_factory=list)
-    error_counts: Dict[str, int] = field(default_factory=dict)
+    response_times: Deque[float] = field(default_factory=lambda: deque(maxlen=RESPONSE_TIME_WINDOW))
+    error_counts: CounterType[str] = field(default_factory=Counter)
     current_state: str = "stopped"
     last_attempt_result: Optional[str] = None
     current_retry_count: int = 0
+    response_time_sum: float = 0.0
+    response_time_count: int = 0
+
+    def record_response_time(self, response_time: float) -> None:
+        """Record a response time, dropping the oldest once the window is full."""
+        self.response_times.append(response_time)
+        self.response_time_sum += response_time
+        self.response_time_count += 1
+
+    @property
+    def average_response_time(self) -> float:
+        """Average of all response times recorded so far."""
+        if not self.response_time_count:
+            return 0
+        return self.response_time_sum / self.response_time_count
 
     def record_error(self, error_type: str) -> None:
         """Record an error occurrence."""
-        if error_type not in self.error_counts:
-            self.error_counts[error_type] = 0
         self.error_counts[error_type] += 1
 
 class MonitoringSystem:
     """Manages monitoring, metrics collection, and status reporting."""
     
-    def __init__(self, metrics_file: str = "checkout_metrics.json"):
+    def __init__(self, metrics_file: str = "checkout_metrics.json",
+                 events_file: Optional[str] = None):
         self.logger = logging.getLogger(__name__)
         self.metrics = MetricsData()
         self.metrics_file = metrics_file
-        self._ensure_metrics_file()
+        self.events_file = events_file
+        self._path = Path(metrics_file)
+        self._tmp_path = Path(f"{metrics_file}.tmp")
+        self._lock = threading.RLock()
+        # Optional append-only JSON-Lines log of individual events, kept open between writes
+        self._events = open(events_file, "ab", buffering=0) if events_file else None
+        self._dirty_count = 0
+        self._last_flush = time.monotonic()
+        self._last_notify = float("-inf")
+        self.save_metrics()  # Start every run from a fresh snapshot
+        self._stop_flusher = threading.Event()
+        self._flusher = threading.Thread(
+            target=self._flush_periodically, name="metrics-flusher", daemon=True
+        )
+        self._flusher.start()
+        atexit.register(self.close)
+
+    def _flush_periodically(self) -> None:
+        """Write pending changes in the background until closed."""
+        while not self._stop_flusher.wait(BACKGROUND_FLUSH_INTERVAL):
+            try:
+                self.flush()
+            except OSError as e:
+                self.logger.warning(f"Failed to write metrics: {e}")
 
-    def _ensure_metrics_file(self) -> None:
-        """Create metrics file if it doesn't exist."""
-        if not os.path.exists(self.metrics_file):
-            self.save_metrics()
+    def _mark_dirty(self) -> None:
+        """Note a change and write it out if the batch is due."""
+        with self._lock:
+            self._dirty_count += 1
+            if (self._dirty_count >= FLUSH_MAX_PENDING
+                    or time.monotonic() - self._last_flush > FLUSH_INTERVAL):
+                self.save_metrics()
+
+    def flush(self) -> None:
+        """Write metrics to file if there are unsaved changes."""
+        with self._lock:
+            if self._dirty_count:
+                self.save_metrics()
+
+    def close(self) -> None:
+        """Stop the background writer, flush pending changes and close the event log."""
+        # Drop the exit hook so a closed instance can be garbage collected
+        atexit.unregister(self.close)
+        self._stop_flusher.set()
+        self.flush()
+        with self._lock:
+            if self._events is not None:
+                self._events.close()
+                self._events = None
+
+    def _log_event(self, event: str, **fields: Any) -> None:
+        """Append one event to the JSON-Lines event log."""
+        if self._events is None:
+            return
+        fields["event"] = event
+        fields["time"] = datetime.now()
+        self._events.write(self._dumps(fields) + b"\n")
 
     def record_attempt(self, success: bool, response_time: float) -> None:
         """Record an attempt with its outcome and response time."""
-        self.metrics.total_attempts += 1
-        if success:
-            self.metrics.successful_attempts += 1
-            self.metrics.last_attempt_result = "success"
-        else:
-            self.metrics.failed_attempts += 1
-            self.metrics.last_attempt_result = "failure"
-        
-        self.metrics.response_times.append(response_time)
-        self.save_metrics()
+        with self._lock:
+            self.metrics.total_attempts += 1
+            if success:
+                self.metrics.successful_attempts += 1
+                self.metrics.last_attempt_result = "success"
+            else:
+                self.metrics.failed_attempts += 1
+                self.metrics.last_attempt_result = "failure"
+
+            self.metrics.record_response_time(response_time)
+            self._log_event("attempt", success=success, response_time=response_time)
+            self._mark_dirty()
         self._notify_status()
 
     def record_error(self, error_type: str) -> None:
         """Record an error occurrence."""
-        self.metrics.record_error(error_type)
-        self.save_metrics()
+        with self._lock:
+            self.metrics.record_error(error_type)
+            self._log_event("error", error_type=error_type)
+            self._mark_dirty()
 
     def update_state(self, state: str) -> None:
         """Update the current state of the bot."""
-        self.metrics.current_state = state
+        with self._lock:
+            self.metrics.current_state = state
+            self._log_event("state", state=state)
+            self._mark_dirty()
         self._notify_status()
-        self.save_metrics()
 
     def update_retry_count(self, count: int) -> None:
         """Update the current retry count."""
-        self.metrics.current_retry_count = count
+        with self._lock:
+            self.metrics.current_retry_count = count
+            self._mark_dirty()
         self._notify_status()
-        self.save_metrics()
 
     def _notify_status(self) -> None:
-        """Display current status in console."""
-        status_msg = (
-            f"\nStatus: {self.metrics.current_state.upper()}\n"
-            f"Last attempt: {self.metrics.last_attempt_result or 'N/A'}\n"
-            f"Current retry: {self.metrics.current_retry_count}\n"
-            f"Success rate: {self._calculate_success_rate():.1f}%\n"
+        """Display current status in console, at most once per NOTIFY_INTERVAL."""
+        now = time.monotonic()
+        if now - self._last_notify < NOTIFY_INTERVAL or not self.logger.isEnabledFor(logging.INFO):
+            return
+        self._last_notify = now
+        self.logger.info(
+            "\nStatus: %s\nLast attempt: %s\nCurrent retry: %d\nSuccess rate: %.1f%%\n",
+            self.metrics.current_state.upper(),
+            self.metrics.last_attempt_result or 'N/A',
+            self.metrics.current_retry_count,
+            self._calculate_success_rate(),
         )
-        self.logger.info(status_msg)
 
     def _calculate_success_rate(self) -> float:
         """Calculate the current success rate."""
@@ -88,13 +185,23 @@ class MonitoringSystem:
         return (self.metrics.successful_attempts / self.metrics.total_attempts) * 100
 
     def save_metrics(self) -> None:
-        """Save current metrics to file in JSON format."""
+        """Save current metrics to file in JSON format.
+
+        The file is replaced atomically so readers never see a partial write.
+        """
+        with self._lock:
+            self._write_metrics()
+            self._dirty_count = 0
+            self._last_flush = time.monotonic()
+
+    def _write_metrics(self) -> None:
+        """Serialize metrics to a temporary file and move it into place."""
         metrics_dict = {
-            "start_time": self.metrics.start_time.isoformat(),
+            "start_time": self.metrics.start_time,
             "total_attempts": self.metrics.total_attempts,
             "successful_attempts": self.metrics.successful_attempts,
             "failed_attempts": self.metrics.failed_attempts,
-            "average_response_time": sum(self.metrics.response_times) / len(self.metrics.response_times) if self.metrics.response_times else 0,
+            "average_response_time": self.metrics.average_response_time,
             "error_counts": dict(self.metrics.error_counts),  # Ensure we get a fresh copy
             "current_state": self.metrics.current_state,
             "last_attempt_result": self.metrics.last_attempt_result,
@@ -102,5 +209,14 @@ class MonitoringSystem:
             "success_rate": self._calculate_success_rate()
         }
         
-        with open(self.metrics_file, 'w') as f:
-            json.dump(metrics_dict, f, indent=2)
+        self._tmp_path.write_bytes(self._dumps(metrics_dict, indent=self.logger.isEnabledFor(logging.DEBUG)))
+        self._tmp_path.replace(self._path)
+
+    def _dumps(self, data: Dict, indent: bool = False) -> bytes:
+        """Serialize to JSON bytes, with orjson when it is available."""
+        if orjson is not None:
+            encoded: bytes = orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+            return encoded
+        return json.dumps(
+            data, indent=2 if indent else None, default=datetime.isoformat
+        ).encode()
@@ -9,13 +9,41 @@ from selenium.common.exceptions import (
     StaleElementReferenceException,
     WebDriverException
 )
-from typing import Optional, Tuple, Any, Dict, Callable
+from typing import ClassVar, Optional, Tuple, Any, Dict, Callable, List, Sequence, Set, FrozenSet
 from selenium.webdriver.remote.webelement import WebElement
 from .logging import get_logger
 from .error_recovery import ErrorRecoveryManager
 
 logger = get_logger(__name__)
 
+# Scroll and click in one script so each click costs a single round trip.
+SCROLL_AND_CLICK_JS = "arguments[0].scrollIntoView({block: 'center'}); arguments[0].click();"
+
+# Report which of the given selectors match a rendered element, in one call
+VERIFY_ELEMENTS_JS = """
+return arguments[0].map(function (selector) {
+    var element = document.querySelector(selector);
+    return !!element && element.getClientRects().length > 0;
+});
+"""
+
+# Walk the page once for a union of selectors and report which of them matched
+SNAPSHOT_ELEMENTS_JS = """
+var selectors = arguments[1];
+var matched = [];
+document.querySelectorAll(arguments[0]).forEach(function (element) {
+    if (element.getClientRects().length === 0) {
+        return;
+    }
+    selectors.forEach(function (selector, index) {
+        if (!matched[index] && element.matches(selector)) {
+            matched[index] = true;
+        }
+    });
+});
+return selectors.map(function (selector, index) { return !!matched[index]; });
+"""
+
 class PageInteractionError(Exception):
     """Base exception for page interaction errors."""
     pass
@@ -39,6 +67,19 @@ class PageInteractor:
         'out_of_stock_msg': "p.m-toast__title.a-fontStyle.-emphasis-3.-no-rich-text[data-cy-id='toast__title']"
     }
 
+    # Ready-made (By, selector) locators for the selectors above
+    _LOCATORS: ClassVar[Dict[str, Tuple[str, str]]] = {
+        name: (By.CSS_SELECTOR, selector) for name, selector in SELECTORS.items()
+    }
+
+    # Text of the toast shown when the item is out of stock
+    OUT_OF_STOCK_TEXT = 'Unfortunately this item is out of stock'
+
+    # Elements the checkout steps click
+    _CHECKOUT_ELEMENTS: ClassVar[FrozenSet[str]] = frozenset(
+        ('proceed_button', 'terms_checkbox', 'agree_button')
+    )
+
     def __init__(self, driver: WebDriver, wait_timeout: int = 10, restart_callback: Optional[Callable] = None):
         """Initialize the page interactor with a WebDriver instance.
         
@@ -49,8 +90,29 @@ class PageInteractor:
         """
         self.driver = driver
         self.wait_timeout = wait_timeout
-        self.wait = WebDriverWait(driver, wait_timeout)
-        self.recovery = ErrorRecoveryManager(driver, restart_callback)
+        self._waits: Dict[float, WebDriverWait] = {}
+        self.wait = self._wait(wait_timeout)
+        self._selectors_items = tuple(self.SELECTORS.items())
+        self._union = ", ".join(self.SELECTORS.values())
+        self._verify_cache: Dict[str, Dict[str, bool]] = {}
+        self.recovery = ErrorRecoveryManager(
+            driver, restart_callback, on_page_change=self.invalidate_verify_cache
+        )
+
+    def _wait(self, timeout: Optional[float] = None) -> WebDriverWait:
+        """Return a cached WebDriverWait for the given timeout.
+        
+        Args:
+            timeout: Timeout in seconds, defaults to wait_timeout
+            
+        Returns:
+            WebDriverWait: Wait bound to this driver and timeout
+        """
+        timeout = timeout or self.wait_timeout
+        wait = self._waits.get(timeout)
+        if wait is None:
+            wait = self._waits[timeout] = WebDriverWait(self.driver, timeout)
+        return wait
 
     def wait_for_element(self, selector: str, timeout: Optional[int] = None) -> WebElement:
         """Wait for an element to be present and visible with recovery.
@@ -67,9 +129,8 @@ class PageInteractor:
         """
         while True:
             try:
-                element = self.wait.until(
-                    EC.visibility_of_element_located((By.CSS_SELECTOR, selector)),
-                    timeout or self.wait_timeout
+                element = self._wait(timeout).until(
+                    EC.visibility_of_element_located((By.CSS_SELECTOR, selector))
                 )
                 self.recovery.reset()  # Reset recovery state on success
                 return element
@@ -93,8 +154,7 @@ class PageInteractor:
         """
         while True:
             try:
-                self.driver.execute_script("arguments[0].scrollIntoView(true);", element)
-                element.click()
+                self.driver.execute_script(SCROLL_AND_CLICK_JS, element)
                 logger.info(f"Clicked {element_name}")
                 self.recovery.reset()  # Reset recovery state on success
                 return True
@@ -104,20 +164,27 @@ class PageInteractor:
                     logger.error(f"Failed to click {element_name} after recovery attempts")
                     raise ElementNotInteractableError(f"Could not click {element_name} after recovery attempts") from e
 
-    def click_proceed_to_pay(self) -> bool:
-        """Click the 'Proceed to pay' button."""
+    def click_proceed_to_pay(self, timeout: Optional[float] = None) -> bool:
+        """Click the 'Proceed to pay' button.
+        
+        Args:
+            timeout: Optional custom timeout in seconds
+        """
         try:
-            button = self.wait.until(
-                EC.element_to_be_clickable((By.CSS_SELECTOR, self.SELECTORS['proceed_button']))
+            button = self._wait(timeout).until(
+                EC.element_to_be_clickable(self._LOCATORS['proceed_button'])
             )
             return self.safe_click(button, "proceed to pay button")
         except (TimeoutException, WebDriverException) as e:
             logger.error("Proceed to pay button not clickable", error=str(e))
             raise ElementNotInteractableError("Proceed to pay button not clickable") from e
 
-    def check_terms(self) -> bool:
+    def check_terms(self, timeout: Optional[float] = None) -> bool:
         """Click the terms checkbox.
         
+        Args:
+            timeout: Optional custom timeout in seconds
+        
         Returns:
             bool: True if terms were successfully checked
             
@@ -125,17 +192,20 @@ class PageInteractor:
             ElementNotInteractableError: If checkbox cannot be clicked
         """
         try:
-            checkbox = self.wait.until(
-                EC.element_to_be_clickable((By.CSS_SELECTOR, self.SELECTORS['terms_checkbox']))
+            checkbox = self._wait(timeout).until(
+                EC.element_to_be_clickable(self._LOCATORS['terms_checkbox'])
             )
             return self.safe_click(checkbox, "terms checkbox")
         except (TimeoutException, WebDriverException) as e:
             logger.error("Terms checkbox not clickable", error=str(e))
             raise ElementNotInteractableError("Terms checkbox not clickable") from e
 
-    def click_agree(self) -> bool:
+    def click_agree(self, timeout: Optional[float] = None) -> bool:
         """Click the 'I agree' button in the modal.
         
+        Args:
+            timeout: Optional custom timeout in seconds
+        
         Returns:
             bool: True if button was successfully clicked
             
@@ -143,8 +213,8 @@ class PageInteractor:
             ElementNotInteractableError: If button cannot be clicked
         """
         try:
-            button = self.wait.until(
-                EC.element_to_be_clickable((By.CSS_SELECTOR, self.SELECTORS['agree_button']))
+            button = self._wait(timeout).until(
+                EC.element_to_be_clickable(self._LOCATORS['agree_button'])
             )
             return self.safe_click(button, "agree button")
         except (TimeoutException, WebDriverException) as e:
@@ -159,29 +229,92 @@ class PageInteractor:
         """
         try:
             element = self.wait_for_element(self.SELECTORS['out_of_stock_msg'])
-            is_out = 'Unfortunately this item is out of stock' in element.text
+            is_out = self.OUT_OF_STOCK_TEXT in element.text
             if is_out:
                 logger.warning("Item is out of stock")
             return is_out
         except ElementNotFoundError:
             return False
 
+    def snapshot_present(self) -> Set[str]:
+        """Return the names of the elements currently rendered on the page.
+        
+        Uses a single query for all selectors instead of one wait per element.
+        
+        Returns:
+            set: Names from SELECTORS whose element is visible right now
+        """
+        flags = self.driver.execute_script(
+            SNAPSHOT_ELEMENTS_JS, self._union, [selector for _, selector in self._selectors_items]
+        )
+        return {name for (name, _), present in zip(self._selectors_items, flags) if present}
+
+    def invalidate_verify_cache(self) -> None:
+        """Forget which elements were found, e.g. after a refresh or restart."""
+        self._verify_cache.clear()
+
     def verify_all_elements_present(self) -> Dict[str, bool]:
         """Verify that all required elements are present on the page.
         
+        Elements already found on the current URL are not probed again;
+        only the missing ones are re-checked.
+        
         Returns:
             dict: Mapping of element names to their presence status
         """
-        results = {}
-        for name, selector in self.SELECTORS.items():
-            try:
-                self.wait_for_element(selector, timeout=2)  # Short timeout for quick checks
-                results[name] = True
-                logger.info(f"Found element: {name}")
-            except ElementNotFoundError:
-                results[name] = False
-                logger.warning(f"Missing element: {name}")
-        return results
+        found = self._verify_cache.setdefault(self.driver.current_url, {})
+        missing = [(name, selector) for name, selector in self._selectors_items if not found.get(name)]
+        if missing:
+            flags = self._probe_elements([selector for _, selector in missing])
+            for (name, _), present in zip(missing, flags):
+                if present:
+                    found[name] = True
+                    logger.info(f"Found element: {name}")
+                else:
+                    logger.warning(f"Missing element: {name}")
+        return {name: found.get(name, False) for name, _ in self._selectors_items}
+
+    def _probe_elements(self, selectors: Sequence[str], timeout: float = 2) -> List[bool]:
+        """Check several selectors for visible elements with one script per poll.
+        
+        Args:
+            selectors: CSS selectors to check
+            timeout: Time to wait for all of them to appear in seconds
+            
+        Returns:
+            list: Visibility flag for each selector, in order
+        """
+        flags: List[bool] = [False] * len(selectors)
+        
+        def all_visible(driver: WebDriver) -> bool:
+            flags[:] = driver.execute_script(VERIFY_ELEMENTS_JS, list(selectors))
+            return all(flags)
+        
+        try:
+            self._wait(timeout).until(all_visible)
+        except TimeoutException:
+            pass
+        return flags
+
+    def _wait_for_ready_or_out_of_stock(self) -> bool:
+        """Wait for the proceed button or the out-of-stock toast, whichever comes first.
+        
+        Returns:
+            bool: True if the out-of-stock toast appeared
+            
+        Raises:
+            PageInteractionError: If neither appears within the timeout
+        """
+        try:
+            first = self.wait.until(EC.any_of(
+                EC.visibility_of_element_located(self._LOCATORS['out_of_stock_msg']),
+                EC.element_to_be_clickable(self._LOCATORS['proceed_button'])
+            ))
+        except TimeoutException as e:
+            raise PageInteractionError("Checkout page did not become ready") from e
+        if first.get_attribute('data-cy-id') != 'toast__title':
+            return False
+        return self.OUT_OF_STOCK_TEXT in first.text
 
     def complete_checkout_flow(self) -> bool:
         """Execute the complete checkout flow.
@@ -193,15 +326,19 @@ class PageInteractor:
             PageInteractionError: If any step fails
         """
         try:
-            if self.is_out_of_stock():
+            # When the page is already loaded, skip the waits for elements
+            # that are known to be there or known to be absent
+            present = self.snapshot_present()
+            if 'out_of_stock_msg' in present:
+                out_of_stock = self.is_out_of_stock()
+            elif self._CHECKOUT_ELEMENTS <= present:
+                out_of_stock = False
+            else:
+                out_of_stock = self._wait_for_ready_or_out_of_stock()
+            
+            if out_of_stock:
                 logger.warning("Cannot proceed - item is out of stock")
                 return False
-                
-            # Verify critical elements are present
-            element_status = self.verify_all_elements_present()
-            if not all(element_status.values()):
-                missing = [name for name, present in element_status.items() if not present]
-                raise PageInteractionError(f"Missing required elements: {', '.join(missing)}")
             
             # Execute checkout steps
             self.check_terms()
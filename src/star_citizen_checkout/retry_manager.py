@@ -1,6 +1,6 @@
 import time
 import random
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import Callable, Optional, TypeVar, List
 from dataclasses import dataclass
 from .config import RetryConfig
@@ -36,39 +36,52 @@ class RetryStats:
         return sum(self.attempt_intervals) / len(self.attempt_intervals)
 
 class RetryManager:
-    """Manages retry logic with fixed intervals and rate limiting."""
+    """Manages retry logic with decorrelated-jitter backoff and rate limiting."""
     
     def __init__(self, config: RetryConfig):
         self.config = config
         self.stats = RetryStats()
-        self._last_attempt_time: Optional[datetime] = None
+        self._last_attempt_time: Optional[float] = None
         self._attempts_this_minute = 0
-        self._minute_start_time: Optional[datetime] = None
+        self._minute_start: Optional[float] = None
         self._current_attempt: int = 0
-        self.monitoring = MonitoringSystem()
+        self._prev_sleep: float = config.base_interval
+        # Backoff bounds only depend on the (frozen) config, so work them out once
+        self._backoff_floor: float = config.base_interval
+        self._backoff_cap: float = max(config.base_interval, config.max_interval)
+        self.monitoring = MonitoringSystem(events_file=config.events_file)
         self.monitoring.update_state("initialized")
     
-    def _apply_jitter(self, base_interval: float) -> float:
-        """Add small random jitter to prevent thundering herd."""
-        jitter = random.uniform(-0.1, 0.1) * base_interval
-        return max(0.1, base_interval + jitter)
+    def _next_backoff(self, attempt: int) -> float:
+        """Pick the next sleep using decorrelated jitter.
+
+        Each sleep is drawn between ``base_interval`` and ``backoff_factor``
+        times the previous one, capped at ``max_interval``, so transient
+        failures retry quickly while persistent outages back off.
+        """
+        base = self._backoff_floor
+        upper = min(self._backoff_cap, self._prev_sleep * self.config.backoff_factor)
+        sleep = random.uniform(base, max(base, upper))
+        self._prev_sleep = sleep
+        logger.debug(f"Backoff for attempt {attempt}: {sleep:.2f}s")
+        return sleep
     
     def _reset_rate_limit(self):
         """Reset rate limiting counters."""
         self._attempts_this_minute = 0
-        self._minute_start_time = datetime.now()
+        self._minute_start = time.monotonic()
     
     def _check_rate_limit(self) -> bool:
         """Check if we're within rate limits."""
-        now = datetime.now()
+        now = time.monotonic()
         
         # Initialize or reset minute window
-        if not self._minute_start_time or (now - self._minute_start_time) > timedelta(minutes=1):
+        if self._minute_start is None or now - self._minute_start > 60:
             self._reset_rate_limit()
             
         # Check rate limit
         if self._attempts_this_minute >= self.config.max_attempts_per_minute:
-            wait_time = 60 - (now - self._minute_start_time).total_seconds()
+            wait_time = 60 - (now - self._minute_start)
             if wait_time > 0:
                 logger.warning(f"Rate limit reached. Waiting {wait_time:.1f}s")
                 time.sleep(wait_time)
@@ -94,9 +107,9 @@ class RetryManager:
             self._check_rate_limit()
             
             # Record attempt timing
-            attempt_start = datetime.now()
-            if self._last_attempt_time:
-                interval = (attempt_start - self._last_attempt_time).total_seconds()
+            attempt_start = time.monotonic()
+            if self._last_attempt_time is not None:
+                interval = attempt_start - self._last_attempt_time
                 self.stats.add_interval(interval)
             
             # Execute attempt
@@ -111,32 +124,34 @@ class RetryManager:
                 if result:
                     self.stats.successful_attempts += 1
                     self.stats.last_success_time = datetime.now()
-                    attempt_duration = (datetime.now() - attempt_start).total_seconds()
+                    attempt_duration = time.monotonic() - attempt_start
                     self.monitoring.record_attempt(True, attempt_duration)
                     logger.info("Operation succeeded", 
                               total_attempts=self.stats.total_attempts,
                               successful_attempts=self.stats.successful_attempts)
+                    self._prev_sleep = self._backoff_floor
                     self.monitoring.update_state("completed")
+                    self.monitoring.flush()
                     return result
                 
                 self.stats.failed_attempts += 1
                 self.stats.last_failure_time = datetime.now()
-                attempt_duration = (datetime.now() - attempt_start).total_seconds()
+                attempt_duration = time.monotonic() - attempt_start
                 self.monitoring.record_attempt(False, attempt_duration)
                 self.monitoring.update_state("failed")
                 
             except Exception as e:
                 self.stats.failed_attempts += 1
                 self.stats.last_failure_time = datetime.now()
-                attempt_duration = (datetime.now() - attempt_start).total_seconds()
+                attempt_duration = time.monotonic() - attempt_start
                 self.monitoring.record_attempt(False, attempt_duration)
                 self.monitoring.record_error(e.__class__.__name__)
                 self.monitoring.update_state("error")
                 logger.error(f"Attempt failed: {str(e)}")
             
             # Prepare for next attempt
-            self._last_attempt_time = datetime.now()
-            interval = self._apply_jitter(self.config.base_interval)
+            self._last_attempt_time = time.monotonic()
+            interval = self._next_backoff(self._current_attempt)
             self.monitoring.update_retry_count(self.stats.total_attempts)
             
             logger.info(f"Waiting {interval:.1f}s before next attempt")
@@ -146,4 +161,5 @@ class RetryManager:
                       max_retries=self.config.max_retries,
                       total_attempts=self.stats.total_attempts)
         self.monitoring.update_state("stopped")
+        self.monitoring.flush()
         return None
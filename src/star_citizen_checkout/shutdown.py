@@ -1,72 +1,232 @@
 """Module for handling graceful shutdown and cleanup procedures."""
 
+import inspect
 import signal
+import shutil
+import socket
 import tempfile
+import threading
+import time
 import os
+import weakref
 from pathlib import Path
-from typing import Optional, List, Callable, Any, Union
-from selenium import webdriver
+from typing import TYPE_CHECKING, Optional, List, Callable, Any, Union, Set, FrozenSet, Dict, Tuple
+import psutil
 from .logging import get_logger
 
+if TYPE_CHECKING:
+    from selenium import webdriver
+
 logger = get_logger(__name__)
 
+# Seconds to wait for the cleanup phases before giving up on them
+SHUTDOWN_TIMEOUT = 10.0
+
+# Seconds to let driver.quit() run before killing the driver and browser
+QUIT_TIMEOUT = 5.0
+
 class ShutdownManager:
     """Manages graceful shutdown and cleanup procedures."""
     
     def __init__(self):
-        self.driver: Optional[webdriver.Remote] = None
-        self.temp_files: List[str] = []  # Store as strings instead of Path objects
-        self.cleanup_callbacks: List[Callable] = []
+        self.driver: Optional["webdriver.Remote"] = None
+        self.temp_files: Set[str] = set()  # Store as strings instead of Path objects
+        # Bound methods are held weakly so registering doesn't keep their owner alive
+        self.cleanup_callbacks: List[Union[Callable[[], Any], "weakref.WeakMethod[Callable[[], Any]]"]] = []
+        self._shutting_down = False
+        # Reentrant so a signal arriving while the flag is being set can't deadlock
+        self._shutdown_lock = threading.RLock()
+        self._signal_thread: Optional[threading.Thread] = None
+        self._wakeup_sockets: Optional[Tuple[socket.socket, socket.socket]] = None
+        self._previous_wakeup_fd = -1
+        self._previous_handlers: Dict[int, Any] = {}
         self._setup_signal_handlers()
     
     def _setup_signal_handlers(self) -> None:
-        """Set up handlers for SIGTERM and SIGINT."""
-        signal.signal(signal.SIGTERM, self._handle_signal)
-        signal.signal(signal.SIGINT, self._handle_signal)
+        """Set up handlers for SIGTERM and SIGINT, plus SIGHUP and SIGQUIT where available."""
+        signums = [signal.SIGTERM, signal.SIGINT]
+        for name in ("SIGHUP", "SIGQUIT"):
+            if hasattr(signal, name):  # Not available on Windows
+                signums.append(getattr(signal, name))
+        self._signums: FrozenSet[int] = frozenset(signums)
+        self._start_signal_thread()
+        for signum in signums:
+            self._previous_handlers[signum] = signal.signal(signum, self._handle_signal)
+    
+    def _start_signal_thread(self) -> None:
+        """Route signals through a wakeup socket to a thread that runs shutdown.
+        
+        The interpreter writes each signal number to the socket, so the
+        handler itself has nothing to do and cleanup runs outside signal
+        context, free to log and block.
+        """
+        receiver, sender = socket.socketpair()
+        sender.setblocking(False)
+        try:
+            # Kept so close() can hand the wakeup fd back, e.g. to asyncio
+            self._previous_wakeup_fd = signal.set_wakeup_fd(sender.fileno())
+        except ValueError:
+            # Only the main thread may set the wakeup fd; shut down from the
+            # handler instead
+            receiver.close()
+            sender.close()
+            return
+        self._wakeup_sockets = (receiver, sender)
+        self._signal_thread = threading.Thread(
+            target=self._wait_for_signals, args=(receiver,), name="shutdown-signals", daemon=True
+        )
+        self._signal_thread.start()
+    
+    def _wait_for_signals(self, receiver: socket.socket) -> None:
+        """Run shutdown when one of the handled signals is delivered."""
+        while True:
+            data = receiver.recv(1)
+            if not data:
+                return
+            if data[0] in self._signums:
+                sig_name = signal.Signals(data[0]).name
+                logger.info(f"Received {sig_name} signal, initiating shutdown...")
+                self.shutdown(f"Received {sig_name}")
+    
+    def _owns_wakeup_fd(self) -> bool:
+        """Check that the interpreter still writes signals to our wakeup socket."""
+        if self._wakeup_sockets is None:
+            return False
+        current = signal.set_wakeup_fd(-1)
+        signal.set_wakeup_fd(current)
+        return current == self._wakeup_sockets[1].fileno()
     
     def _handle_signal(self, signum: int, frame: Optional[Any]) -> None:
         """Handle shutdown signals."""
+        if self._owns_wakeup_fd():
+            return  # The signal thread picks it up from the wakeup socket
+        # No signal thread, or another component took over the wakeup fd
         sig_name = signal.Signals(signum).name
         logger.info(f"Received {sig_name} signal, initiating shutdown...")
         self.shutdown(f"Received {sig_name}")
     
-    def register_browser(self, driver: webdriver.Remote) -> None:
+    def close(self) -> None:
+        """Restore the previous signal handlers and wakeup fd and stop the signal thread."""
+        try:
+            for signum, handler in self._previous_handlers.items():
+                if handler is not None:  # Handlers installed outside Python can't be restored
+                    signal.signal(signum, handler)
+            if self._owns_wakeup_fd():
+                signal.set_wakeup_fd(self._previous_wakeup_fd)
+        except ValueError:
+            logger.warning("Signal handlers can only be restored from the main thread")
+        self._previous_handlers.clear()
+        if self._wakeup_sockets is None:
+            return
+        receiver, sender = self._wakeup_sockets
+        # Closing the sending end makes recv() return b"" and the thread exit
+        sender.close()
+        if self._signal_thread is not None:
+            self._signal_thread.join(1.0)
+            self._signal_thread = None
+        receiver.close()
+        self._wakeup_sockets = None
+    
+    def register_browser(self, driver: "webdriver.Remote") -> None:
         """Register browser instance for cleanup."""
         self.driver = driver
     
     def register_temp_file(self, file_path: Union[Path, str]) -> None:
         """Register temporary file for cleanup."""
-        self.temp_files.append(str(file_path))
+        self.temp_files.add(os.fspath(file_path))
     
     def register_cleanup_callback(self, callback: Callable) -> None:
-        """Register additional cleanup callback."""
+        """Register additional cleanup callback.
+        
+        Bound methods are stored as weak references and skipped at shutdown
+        if their object has been garbage collected in the meantime.
+        """
+        if inspect.ismethod(callback):
+            callback = weakref.WeakMethod(callback)
         self.cleanup_callbacks.append(callback)
     
+    def reset(self) -> None:
+        """Forget all registered resources and allow another shutdown.
+        
+        Signal handlers stay installed, so an instance can be reused without
+        going through __init__ again.
+        """
+        with self._shutdown_lock:
+            self.driver = None
+            self.temp_files.clear()
+            self.cleanup_callbacks.clear()
+            self._shutting_down = False
+    
     def cleanup_browser(self) -> None:
-        """Clean up browser session."""
+        """Clean up browser session.
+        
+        If quitting takes longer than QUIT_TIMEOUT, the driver process and
+        the browser it started are killed so a frozen browser can't hang
+        shutdown.
+        """
         if self.driver:
+            watchdog = threading.Timer(QUIT_TIMEOUT, self._force_kill_browser, args=(self.driver,))
+            watchdog.daemon = True
+            watchdog.start()
             try:
                 logger.info("Closing browser session...")
                 self.driver.quit()
                 self.driver = None
             except Exception as e:
                 logger.error(f"Error closing browser: {e}")
+            finally:
+                watchdog.cancel()
+    
+    def _force_kill_browser(self, driver: "webdriver.Remote") -> None:
+        """Kill the driver service process and the browser processes it started."""
+        process = getattr(getattr(driver, "service", None), "process", None)
+        if process is None:
+            logger.error(f"Browser did not quit within {QUIT_TIMEOUT:.0f}s and has no local process to kill")
+            return
+        
+        logger.warning(f"Browser did not quit within {QUIT_TIMEOUT:.0f}s, killing it")
+        try:
+            children = psutil.Process(process.pid).children(recursive=True)
+        except psutil.Error:
+            children = []
+        for child in children:
+            try:
+                child.kill()
+            except psutil.Error:
+                pass
+        try:
+            process.kill()
+        except OSError as e:
+            logger.error(f"Error killing driver process: {e}")
     
     def cleanup_temp_files(self) -> None:
         """Clean up temporary files."""
-        for file_path in self.temp_files:
+        # Drain rather than iterate, so a file registered while cleanup runs
+        # on the shutdown pool is still removed instead of breaking the loop
+        while self.temp_files:
+            file_path = self.temp_files.pop()
             try:
-                path = Path(file_path)
-                if path.exists():
-                    logger.info(f"Removing temporary file: {file_path}")
-                    path.unlink()
+                os.unlink(file_path)
+                logger.info(f"Removed temporary file: {file_path}")
+            except FileNotFoundError:
+                pass
+            except (IsADirectoryError, PermissionError) as e:
+                # Linux reports a directory as IsADirectoryError; macOS and
+                # Windows raise PermissionError instead
+                if os.path.isdir(file_path):
+                    shutil.rmtree(file_path, ignore_errors=True)
+                    logger.info(f"Removed temporary directory: {file_path}")
+                else:
+                    logger.error(f"Error removing temp file {file_path}: {e}")
             except Exception as e:
                 logger.error(f"Error removing temp file {file_path}: {e}")
-        self.temp_files.clear()
     
     def run_cleanup_callbacks(self) -> None:
         """Run registered cleanup callbacks."""
-        for callback in self.cleanup_callbacks:
+        for entry in self.cleanup_callbacks:
+            callback = entry() if isinstance(entry, weakref.WeakMethod) else entry
+            if callback is None:
+                continue  # Owner of a bound method was garbage collected
             try:
                 callback()
             except Exception as e:
@@ -74,12 +234,40 @@ class ShutdownManager:
         self.cleanup_callbacks.clear()
     
     def shutdown(self, reason: str = "Shutdown requested") -> None:
-        """Execute complete shutdown procedure."""
+        """Execute complete shutdown procedure.
+        
+        Only the first call does any work; later calls, e.g. from a second
+        signal arriving mid-cleanup, return immediately.
+        """
+        with self._shutdown_lock:
+            if self._shutting_down:
+                logger.info(f"Shutdown already in progress, ignoring: {reason}")
+                return
+            self._shutting_down = True
+        
         logger.info(f"Initiating shutdown: {reason}")
         
-        # Run cleanup in order
-        self.cleanup_browser()
-        self.cleanup_temp_files()
-        self.run_cleanup_callbacks()
+        # The phases are independent, so run them side by side. Daemon
+        # threads, unlike executor workers, aren't joined at interpreter
+        # exit, so a hung browser can't hold up the rest or the exit itself
+        phases = {
+            "browser": self.cleanup_browser,
+            "temp files": self.cleanup_temp_files,
+            "callbacks": self.run_cleanup_callbacks,
+        }
+        threads = {
+            name: threading.Thread(target=phase, name=f"shutdown-{name}", daemon=True)
+            for name, phase in phases.items()
+        }
+        for thread in threads.values():
+            thread.start()
+        deadline = time.monotonic() + SHUTDOWN_TIMEOUT
+        for thread in threads.values():
+            thread.join(max(0.0, deadline - time.monotonic()))
+        pending = [name for name, thread in threads.items() if thread.is_alive()]
         
-        logger.info("Shutdown complete")
+        if pending:
+            names = ", ".join(pending)
+            logger.error(f"Shutdown timed out after {SHUTDOWN_TIMEOUT:.0f}s waiting for: {names}")
+        else:
+            logger.info("Shutdown complete")
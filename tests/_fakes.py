@@ -0,0 +1,34 @@
+"""Lightweight test doubles for tests that only count calls."""
+
+from typing import Callable, Optional, Union
+
+SideEffect = Optional[Union[BaseException, Callable[[], object]]]
+
+def _apply(side_effect: SideEffect) -> None:
+    """Raise or call a side effect the way Mock does."""
+    if isinstance(side_effect, BaseException):
+        raise side_effect
+    if side_effect is not None:
+        side_effect()
+
+class FakeDriver:
+    """Stand-in for a WebDriver that records quit() calls."""
+
+    def __init__(self, quit_side_effect: SideEffect = None):
+        self.quit_calls = 0
+        self.quit_side_effect = quit_side_effect
+
+    def quit(self) -> None:
+        self.quit_calls += 1
+        _apply(self.quit_side_effect)
+
+class FakeCallback:
+    """Cleanup callback that records how often it was called."""
+
+    def __init__(self, side_effect: SideEffect = None):
+        self.calls = 0
+        self.side_effect = side_effect
+
+    def __call__(self) -> None:
+        self.calls += 1
+        _apply(self.side_effect)
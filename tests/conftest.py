@@ -0,0 +1,96 @@
+"""Shared pytest configuration."""
+
+import hashlib
+from pathlib import Path
+from typing import Iterator, Optional, Set
+
+import pytest
+
+try:
+    import coverage
+except ImportError:  # pragma: no cover - coverage is only present for coverage runs
+    coverage = None
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# The shutdown tests only depend on these files, so with --skip-unchanged a
+# test that passed while they had their current contents is skipped
+SHUTDOWN_TEST_MODULE = "test_shutdown.py"
+SHUTDOWN_SOURCES = (
+    ROOT / "src" / "star_citizen_checkout" / "shutdown.py",
+    ROOT / "src" / "star_citizen_checkout" / "logging.py",
+    ROOT / "tests" / SHUTDOWN_TEST_MODULE,
+    ROOT / "tests" / "_fakes.py",
+)
+SHUTDOWN_HASH_KEY = "star_citizen_checkout/shutdown_passed"
+
+class _ShutdownGate:
+    """Sources hash and the shutdown tests known to pass with it."""
+    hash: Optional[str] = None
+    passed: Set[str] = set()
+
+def _shutdown_sources_hash() -> str:
+    """Hash the contents of every file the shutdown tests depend on."""
+    digest = hashlib.sha256()
+    for path in SHUTDOWN_SOURCES:
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+def _is_shutdown_test(item: pytest.Item) -> bool:
+    return item.path.name == SHUTDOWN_TEST_MODULE
+
+def pytest_configure(config: pytest.Config) -> None:
+    config.addinivalue_line(
+        "markers", "no_cover: pause coverage tracing while the test runs, including its fixtures"
+    )
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_protocol(item: pytest.Item, nextitem: Optional[pytest.Item]) -> Iterator[None]:
+    cov = coverage.Coverage.current() if coverage is not None else None
+    if cov is None or item.get_closest_marker("no_cover") is None:
+        yield
+        return
+    cov.stop()
+    try:
+        yield
+    finally:
+        cov.start()
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    parser.addoption(
+        "--skip-unchanged",
+        action="store_true",
+        default=False,
+        help="Skip shutdown tests that passed with the current sources. Has no effect under pytest-xdist.",
+    )
+
+def pytest_collection_modifyitems(config: pytest.Config, items: list) -> None:
+    if not config.getoption("--skip-unchanged") or getattr(config, "cache", None) is None:
+        return
+    # xdist workers report to a controller that never collects, so the gate
+    # would have nowhere to keep its results; leave every test to run
+    if hasattr(config, "workerinput"):
+        return
+    _ShutdownGate.hash = _shutdown_sources_hash()
+    cached = config.cache.get(SHUTDOWN_HASH_KEY, {})
+    # Tracked per test, so tests left out by -k, --lf or node ids never count as passed
+    _ShutdownGate.passed = set(cached.get("passed", [])) if cached.get("hash") == _ShutdownGate.hash else set()
+    skip = pytest.mark.skip(reason="shutdown sources unchanged since this test last passed")
+    for item in items:
+        if _is_shutdown_test(item) and item.nodeid in _ShutdownGate.passed:
+            item.add_marker(skip)
+
+def pytest_runtest_logreport(report: pytest.TestReport) -> None:
+    if _ShutdownGate.hash is None or Path(report.fspath).name != SHUTDOWN_TEST_MODULE:
+        return
+    if report.failed:
+        _ShutdownGate.passed.discard(report.nodeid)
+    elif report.when == "call" and report.passed:
+        _ShutdownGate.passed.add(report.nodeid)
+
+def pytest_sessionfinish(session: pytest.Session) -> None:
+    if _ShutdownGate.hash is None:
+        return
+    session.config.cache.set(
+        SHUTDOWN_HASH_KEY, {"hash": _ShutdownGate.hash, "passed": sorted(_ShutdownGate.passed)}
+    )
@@ -2,7 +2,7 @@ import pytest
 from pathlib import Path
 import json
 from unittest.mock import patch
-from star_citizen_checkout.cli import CheckoutCLI
+from star_citizen_checkout.cli import CheckoutCLI, FAST_POLL_INTERVAL
 
 @pytest.fixture
 def temp_config(tmp_path):
@@ -84,3 +84,66 @@ def test_general_error_handling():
     with patch.object(cli, "_handle_start", side_effect=Exception("Test error")):
         result = cli.run(["start", "--url", "https://example.com"])
         assert result == 1  # Should return error code
+
+def test_retry_interval_falls_back_to_config_file(temp_config):
+    cli = CheckoutCLI()
+    with patch.object(cli, "_handle_start", return_value=0):
+        cli.run(["start", "--url", "https://example.com", "--config", str(temp_config)])
+    
+    assert cli.config.retry.base_interval == 3.0
+
+def test_fast_poll_overrides_retry_interval(temp_config):
+    cli = CheckoutCLI()
+    with patch.object(cli, "_handle_start", return_value=0):
+        cli.run([
+            "start",
+            "--url", "https://example.com",
+            "--config", str(temp_config),
+            "--retry-interval", "10.0",
+            "--fast-poll"
+        ])
+    
+    assert cli.config.retry.base_interval == 0.5
+
+def test_events_file_from_config_and_command_line(tmp_path):
+    config_file = tmp_path / "config.json"
+    config_file.write_text(json.dumps({"retry": {"events_file": "from_config.jsonl"}}))
+    
+    cli = CheckoutCLI()
+    args = cli.parser.parse_args(["start", "--url", "https://example.com", "--config", str(config_file)])
+    assert cli._create_config(args).retry.events_file == "from_config.jsonl"
+    
+    args = cli.parser.parse_args([
+        "start", "--url", "https://example.com", "--config", str(config_file),
+        "--events-file", "from_cli.jsonl"
+    ])
+    assert cli._create_config(args).retry.events_file == "from_cli.jsonl"
+
+def test_events_file_off_by_default():
+    cli = CheckoutCLI()
+    args = cli.parser.parse_args(["start", "--url", "https://example.com", "--config", "nonexistent.json"])
+    assert cli._create_config(args).retry.events_file is None
+
+def test_backoff_settings_from_config_file(tmp_path):
+    config_file = tmp_path / "config.json"
+    config_file.write_text(json.dumps({"retry": {"max_interval": 30.0, "backoff_factor": 2.0}}))
+    
+    cli = CheckoutCLI()
+    args = cli.parser.parse_args(["start", "--url", "https://example.com", "--config", str(config_file)])
+    config = cli._create_config(args)
+    
+    assert config.retry.max_interval == 30.0
+    assert config.retry.backoff_factor == 2.0
+
+def test_fast_poll_caps_max_interval(tmp_path):
+    config_file = tmp_path / "config.json"
+    config_file.write_text(json.dumps({"retry": {"base_interval": 3.0, "max_interval": 30.0}}))
+    
+    cli = CheckoutCLI()
+    args = cli.parser.parse_args([
+        "start", "--url", "https://example.com", "--config", str(config_file), "--fast-poll"
+    ])
+    config = cli._create_config(args)
+    
+    assert config.retry.base_interval == FAST_POLL_INTERVAL
+    assert config.retry.max_interval == FAST_POLL_INTERVAL
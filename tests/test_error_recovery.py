@@ -39,6 +39,15 @@ def test_error_classification(recovery_manager):
     assert recovery_manager.classify_error(WebDriverException()) == ErrorClassification.NETWORK
     assert recovery_manager.classify_error(Exception()) == ErrorClassification.FATAL
 
+def test_error_classification_subclasses(recovery_manager):
+    """Test that subclasses are classified like their base exception."""
+    class SessionLost(WebDriverException):
+        pass
+    
+    assert recovery_manager.classify_error(SessionLost()) == ErrorClassification.NETWORK
+    assert recovery_manager.classify_error(SessionLost()) == ErrorClassification.NETWORK
+    assert recovery_manager.classify_error(ValueError()) == ErrorClassification.FATAL
+
 def test_recovery_escalation(recovery_manager):
     """Test that recovery levels escalate properly."""
     with patch('time.sleep') as mock_sleep:
@@ -81,6 +90,20 @@ def test_restart_retry_recovery(recovery_manager):
         mock_sleep.assert_called_once_with(30)  # 30 second delay
         recovery_manager.restart_callback.assert_called_once()
 
+def test_page_change_hook(mock_driver, mock_restart_callback):
+    """Test that refresh and restart notify the page change hook."""
+    on_page_change = Mock()
+    manager = ErrorRecoveryManager(mock_driver, mock_restart_callback, on_page_change=on_page_change)
+    with patch('time.sleep'):
+        manager.execute_recovery(TimeoutException())
+        on_page_change.assert_not_called()
+        manager.current_level = RecoveryLevel.REFRESH_RETRY
+        manager.execute_recovery(TimeoutException())
+        on_page_change.assert_called_once()
+        manager.current_level = RecoveryLevel.RESTART_RETRY
+        manager.execute_recovery(TimeoutException())
+        assert on_page_change.call_count == 2
+
 def test_user_intervention(recovery_manager):
     """Test Level 4: User intervention raises exception."""
     recovery_manager.current_level = RecoveryLevel.USER_INTERVENTION
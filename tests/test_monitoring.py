@@ -1,18 +1,25 @@
+import gc
 import json
+import logging
 import os
+import weakref
 from datetime import datetime
 import pytest
+from src.star_citizen_checkout import monitoring as monitoring_module
 from src.star_citizen_checkout.monitoring import MonitoringSystem, MetricsData
 
 @pytest.fixture
 def monitoring():
     """Create a monitoring system with a temporary metrics file."""
     test_file = "test_metrics.json"
-    monitoring = MonitoringSystem(metrics_file=test_file)
+    events_file = "test_events.jsonl"
+    monitoring = MonitoringSystem(metrics_file=test_file, events_file=events_file)
     yield monitoring
     # Cleanup
-    if os.path.exists(test_file):
-        os.remove(test_file)
+    monitoring.close()
+    for path in (test_file, events_file):
+        if os.path.exists(path):
+            os.remove(path)
 
 def test_metrics_file_creation(monitoring):
     """Test that metrics file is created on initialization."""
@@ -50,6 +57,7 @@ def test_update_state(monitoring):
     """Test state updates."""
     monitoring.update_state("running")
     assert monitoring.metrics.current_state == "running"
+    monitoring.flush()
     with open(monitoring.metrics_file) as f:
         data = json.load(f)
     assert data["current_state"] == "running"
@@ -58,6 +66,7 @@ def test_update_retry_count(monitoring):
     """Test retry count updates."""
     monitoring.update_retry_count(5)
     assert monitoring.metrics.current_retry_count == 5
+    monitoring.flush()
     with open(monitoring.metrics_file) as f:
         data = json.load(f)
     assert data["current_retry_count"] == 5
@@ -78,6 +87,7 @@ def test_metrics_file_format(monitoring):
     monitoring.record_attempt(True, 0.5)
     monitoring.record_error("NetworkError")
     monitoring.update_state("running")
+    monitoring.flush()
     
     with open(monitoring.metrics_file) as f:
         data = json.load(f)
@@ -98,3 +108,74 @@ def test_metrics_file_format(monitoring):
     assert all(field in data for field in required_fields)
     assert isinstance(data["error_counts"], dict)
     assert datetime.fromisoformat(data["start_time"])
+
+def test_writes_are_batched(tmp_path, monkeypatch):
+    """Test that rapid updates are coalesced into a single write."""
+    # Keep the time-based flushes out of the way so only flush() writes
+    monkeypatch.setattr(monitoring_module, "FLUSH_INTERVAL", 3600.0)
+    monkeypatch.setattr(monitoring_module, "BACKGROUND_FLUSH_INTERVAL", 3600.0)
+    monitoring = MonitoringSystem(metrics_file=str(tmp_path / "metrics.json"), events_file=None)
+    try:
+        writes = []
+        original_write = monitoring._write_metrics
+        monkeypatch.setattr(monitoring, "_write_metrics", lambda: writes.append(1) or original_write())
+        
+        for count in range(5):
+            monitoring.update_retry_count(count)
+        assert writes == []
+        
+        monitoring.flush()
+        assert len(writes) == 1
+        with open(monitoring.metrics_file) as f:
+            assert json.load(f)["current_retry_count"] == 4
+    finally:
+        monitoring.close()
+
+def test_close_releases_exit_hook(tmp_path):
+    """Test that a closed monitoring system is no longer kept alive by atexit."""
+    monitoring = MonitoringSystem(metrics_file=str(tmp_path / "metrics.json"), events_file=None)
+    monitoring.close()
+    ref = weakref.ref(monitoring)
+    monitoring._flusher.join(5)
+    del monitoring
+    gc.collect()
+    assert ref() is None
+
+def test_response_times_are_bounded():
+    """Test that only recent response times are kept but all are averaged."""
+    metrics = MetricsData()
+    window = metrics.response_times.maxlen
+    for _ in range(window):
+        metrics.record_response_time(1.0)
+    for _ in range(window):
+        metrics.record_response_time(3.0)
+    
+    assert len(metrics.response_times) == window
+    assert metrics.response_time_count == 2 * window
+    assert metrics.average_response_time == pytest.approx(2.0)
+
+def test_events_are_appended(monitoring):
+    """Test that each event is appended to the JSON-Lines log."""
+    monitoring.record_attempt(False, 0.2)
+    monitoring.record_error("TimeoutError")
+    monitoring.update_state("running")
+    
+    with open(monitoring.events_file) as f:
+        events = [json.loads(line) for line in f]
+    
+    assert [e["event"] for e in events] == ["attempt", "error", "state"]
+    assert events[0]["success"] is False
+    assert events[1]["error_type"] == "TimeoutError"
+    assert events[2]["state"] == "running"
+
+def test_status_is_throttled_across_flushes(monitoring, monkeypatch, caplog):
+    """Test that metrics writes don't re-arm the console status throttle."""
+    caplog.set_level(logging.INFO, logger=monitoring.logger.name)
+    monkeypatch.setattr(monitoring_module, "NOTIFY_INTERVAL", 60.0)
+    status_lines = []
+    monkeypatch.setattr(monitoring.logger, "info", lambda *args: status_lines.append(args))
+    
+    for _ in range(2 * monitoring_module.FLUSH_MAX_PENDING + 1):
+        monitoring.record_attempt(False, 0.1)
+    
+    assert len(status_lines) <= 1
@@ -14,9 +14,11 @@ def retry_manager():
     )
     manager = RetryManager(config)
     yield manager
-    # Cleanup metrics file
-    if os.path.exists(manager.monitoring.metrics_file):
-        os.remove(manager.monitoring.metrics_file)
+    # Cleanup metrics and event files
+    manager.monitoring.close()
+    for path in (manager.monitoring.metrics_file, manager.monitoring.events_file):
+        if path and os.path.exists(path):
+            os.remove(path)
 
 def test_retry_manager_monitoring_integration(retry_manager):
     """Test that RetryManager properly updates monitoring metrics."""
@@ -0,0 +1,129 @@
+"""Unit tests for the page interactor's element checks, using a mocked driver.
+
+Unlike test_page_interaction.py these need neither Chrome nor the mock
+checkout server.
+"""
+
+import pytest
+from unittest.mock import Mock, patch
+from selenium.common.exceptions import NoSuchElementException
+from star_citizen_checkout.page_interaction import PageInteractor, PageInteractionError
+
+OUT_OF_STOCK = PageInteractor.SELECTORS['out_of_stock_msg']
+PROCEED = PageInteractor.SELECTORS['proceed_button']
+
+def _flags(*names):
+    """Build the per-selector flags a page script returns when only ``names`` are present."""
+    return [name in names for name in PageInteractor.SELECTORS]
+
+def _toast(text):
+    """Create a visible toast element with the given text."""
+    element = Mock()
+    element.is_displayed.return_value = True
+    element.get_attribute.side_effect = lambda name: 'toast__title' if name == 'data-cy-id' else None
+    element.text = text
+    return element
+
+def _find_only(elements):
+    """Make find_element return elements by selector and raise for the rest."""
+    def find_element(by, selector):
+        if selector in elements:
+            return elements[selector]
+        raise NoSuchElementException(selector)
+    return find_element
+
+@pytest.fixture
+def mock_driver():
+    """Create a mock WebDriver with no elements on the page."""
+    driver = Mock()
+    driver.find_element.side_effect = _find_only({})
+    return driver
+
+@pytest.fixture
+def page_interactor(mock_driver):
+    """Create a PageInteractor with a short wait so timeouts are quick."""
+    return PageInteractor(mock_driver, wait_timeout=0.1)
+
+def test_snapshot_present_maps_flags_to_names(mock_driver, page_interactor):
+    """Test that snapshot_present reports the names whose selectors matched."""
+    mock_driver.execute_script.return_value = _flags('proceed_button', 'agree_button')
+
+    assert page_interactor.snapshot_present() == {'proceed_button', 'agree_button'}
+    mock_driver.execute_script.assert_called_once()
+
+def test_probe_elements_all_visible(mock_driver, page_interactor):
+    """Test that probing stops at the first poll where every selector is visible."""
+    mock_driver.execute_script.return_value = [True, True]
+
+    assert page_interactor._probe_elements(['a', 'b']) == [True, True]
+    mock_driver.execute_script.assert_called_once()
+
+def test_probe_elements_reports_partial_result_on_timeout(mock_driver, page_interactor):
+    """Test that the last flags are returned when not all selectors appear in time."""
+    mock_driver.execute_script.return_value = [True, False]
+
+    assert page_interactor._probe_elements(['a', 'b'], timeout=0.1) == [True, False]
+
+def test_wait_detects_out_of_stock_toast(mock_driver, page_interactor):
+    """Test that the out-of-stock toast is reported when it appears first."""
+    mock_driver.find_element.side_effect = _find_only({OUT_OF_STOCK: _toast(PageInteractor.OUT_OF_STOCK_TEXT)})
+
+    assert page_interactor._wait_for_ready_or_out_of_stock() is True
+
+def test_wait_ignores_unrelated_toast(mock_driver, page_interactor):
+    """Test that a toast with other text doesn't count as out of stock."""
+    mock_driver.find_element.side_effect = _find_only({OUT_OF_STOCK: _toast('Item added to cart')})
+
+    assert page_interactor._wait_for_ready_or_out_of_stock() is False
+
+def test_wait_returns_when_proceed_button_clickable(mock_driver, page_interactor):
+    """Test that a clickable proceed button means the page is ready and in stock."""
+    button = Mock()
+    button.is_displayed.return_value = True
+    button.is_enabled.return_value = True
+    button.get_attribute.return_value = '__place-order-button'
+    mock_driver.find_element.side_effect = _find_only({PROCEED: button})
+
+    assert page_interactor._wait_for_ready_or_out_of_stock() is False
+
+def test_wait_raises_when_neither_appears(page_interactor):
+    """Test that a page with neither element raises PageInteractionError."""
+    with pytest.raises(PageInteractionError):
+        page_interactor._wait_for_ready_or_out_of_stock()
+
+def test_checkout_flow_stops_on_out_of_stock_snapshot(mock_driver, page_interactor):
+    """Test that an out-of-stock toast in the snapshot ends the flow without waiting."""
+    mock_driver.execute_script.return_value = _flags('out_of_stock_msg')
+
+    with patch.object(page_interactor, 'is_out_of_stock', return_value=True), \
+         patch.object(page_interactor, '_wait_for_ready_or_out_of_stock') as mock_wait, \
+         patch.object(page_interactor, 'check_terms') as mock_check_terms:
+        assert page_interactor.complete_checkout_flow() is False
+
+    mock_wait.assert_not_called()
+    mock_check_terms.assert_not_called()
+
+def test_checkout_flow_skips_wait_when_elements_present(mock_driver, page_interactor):
+    """Test that the flow goes straight to the steps when every checkout element is present."""
+    mock_driver.execute_script.return_value = _flags('proceed_button', 'terms_checkbox', 'agree_button')
+
+    with patch.object(page_interactor, '_wait_for_ready_or_out_of_stock') as mock_wait, \
+         patch.object(page_interactor, 'check_terms') as mock_check_terms, \
+         patch.object(page_interactor, 'click_agree') as mock_click_agree, \
+         patch.object(page_interactor, 'click_proceed_to_pay') as mock_click_proceed:
+        assert page_interactor.complete_checkout_flow() is True
+
+    mock_wait.assert_not_called()
+    mock_check_terms.assert_called_once()
+    mock_click_agree.assert_called_once()
+    mock_click_proceed.assert_called_once()
+
+def test_checkout_flow_raises_when_page_never_ready(mock_driver, page_interactor):
+    """Test that the flow raises when neither the toast nor the checkout elements appear."""
+    mock_driver.execute_script.return_value = _flags()
+
+    with patch.object(page_interactor, 'check_terms') as mock_check_terms:
+        with pytest.raises(PageInteractionError):
+            page_interactor.complete_checkout_flow()
+
+    mock_check_terms.assert_not_called()
@@ -1,5 +1,6 @@
 import pytest
 from datetime import datetime, timedelta
+import json
 import time
 from star_citizen_checkout.config import RetryConfig
 from star_citizen_checkout.retry_manager import RetryManager, RetryStats
@@ -146,22 +147,38 @@ def test_infinite_retries():
     assert manager.stats.successful_attempts == 1
 
 def test_jitter():
-    """Test that jitter is applied to intervals."""
+    """Test that decorrelated jitter grows the backoff within bounds."""
     config = RetryConfig(
         base_interval=1.0,
+        max_interval=10.0,
+        backoff_factor=3.0,
         max_retries=5,
         max_attempts_per_minute=10
     )
     
     manager = RetryManager(config)
     
-    # Collect several jittered intervals
+    # Collect several backoff intervals
     intervals = []
-    for _ in range(10):
-        interval = manager._apply_jitter(config.base_interval)
+    for attempt in range(1, 11):
+        prev = manager._prev_sleep
+        interval = manager._next_backoff(attempt)
+        # Each sleep lies between base and factor * previous, capped
+        assert config.base_interval <= interval <= min(config.max_interval, prev * 3.0)
         intervals.append(interval)
     
     # Verify jitter was applied (not all intervals are exactly 1.0)
     assert not all(i == 1.0 for i in intervals)
-    # Verify jitter is within bounds (±10%)
-    assert all(0.9 <= i <= 1.1 for i in intervals)
+    assert all(i <= config.max_interval for i in intervals)
+
+def test_events_file_passed_to_monitoring(tmp_path):
+    """Test that the configured events file receives the retry events."""
+    events_file = tmp_path / "events.jsonl"
+    config = RetryConfig(base_interval=0.1, max_retries=1, events_file=str(events_file))
+    
+    manager = RetryManager(config)
+    manager.execute_with_retry(lambda: True)
+    manager.monitoring.close()
+    
+    events = [json.loads(line)["event"] for line in events_file.read_text().splitlines()]
+    assert "attempt" in events
@@ -1,6 +1,8 @@
 import pytest
+from unittest.mock import patch
 from selenium.webdriver.common.by import By
-from star_citizen_checkout.config import Config, BrowserMode
+from star_citizen_checkout import browser
+from star_citizen_checkout.config import Config, BrowserConfig, BrowserMode
 from star_citizen_checkout.browser import BrowserFactory
 
 def test_browser_factory():
@@ -25,3 +27,46 @@ def test_config_validation():
     assert custom_config.browser.browser_type == "firefox"
     assert custom_config.retry.base_interval == 10
     assert custom_config.retry.max_retries == 50
+
+def test_driver_resolution_is_cached_or_skipped():
+    """Test that the driver is resolved once and skipped when a path is configured."""
+    browser._resolve_driver_path.cache_clear()
+    with patch.object(browser, "ChromeDriverManager") as manager, \
+         patch.object(browser, "ChromeService") as service, \
+         patch.object(browser.webdriver, "Chrome"):
+        manager.return_value.install.return_value = "/cached/chromedriver"
+        
+        BrowserFactory.create_driver(BrowserConfig())
+        BrowserFactory.create_driver(BrowserConfig())
+        assert manager.return_value.install.call_count == 1
+        service.assert_called_with("/cached/chromedriver")
+        
+        BrowserFactory.create_driver(BrowserConfig(driver_path="/opt/chromedriver"))
+        assert manager.return_value.install.call_count == 1
+        service.assert_called_with("/opt/chromedriver")
+    browser._resolve_driver_path.cache_clear()
+
+def test_chrome_blocks_media_unless_disabled():
+    """Test that Chrome drivers block media requests unless configured not to."""
+    with patch.object(browser, "ChromeService"), \
+         patch.object(browser.webdriver, "Chrome") as chrome:
+        driver = chrome.return_value
+        
+        BrowserFactory.create_driver(BrowserConfig(driver_path="/opt/chromedriver"))
+        driver.execute_cdp_cmd.assert_called_with(
+            "Network.setBlockedURLs", {"urls": browser.BLOCKED_MEDIA_URLS}
+        )
+        
+        driver.execute_cdp_cmd.reset_mock()
+        BrowserFactory.create_driver(BrowserConfig(driver_path="/opt/chromedriver", block_media=False))
+        driver.execute_cdp_cmd.assert_not_called()
+
+def test_chrome_attaches_to_debug_port():
+    """Test that a configured debug port attaches instead of launching Chrome."""
+    with patch.object(browser, "ChromeService"), \
+         patch.object(browser.webdriver, "Chrome") as chrome:
+        BrowserFactory.create_driver(BrowserConfig(driver_path="/opt/chromedriver", attach_debug_port=9222))
+        options = chrome.call_args.kwargs["options"]
+        
+        assert options.experimental_options["debuggerAddress"] == "127.0.0.1:9222"
+        assert "--headless=new" not in options.arguments
@@ -1,12 +1,95 @@
-"""Tests for the shutdown manager functionality."""
+"""Tests for the shutdown manager functionality.
 
+The tests are independent of each other and safe to spread across
+pytest-xdist workers::
+
+    pytest -n auto tests/test_shutdown.py
+"""
+
+import gc
 import pytest
 import signal
 import os
+import socket
+import subprocess
+import sys
+import threading
+import time
 from pathlib import Path
-from unittest.mock import Mock, patch, mock_open
-from selenium import webdriver
+from unittest.mock import Mock, patch
+import psutil
+from star_citizen_checkout import shutdown as shutdown_module
 from star_citizen_checkout.shutdown import ShutdownManager
+from tests._fakes import FakeCallback, FakeDriver
+
+# Pure fake/mock dispatch; line tracing costs more than the coverage is worth
+pytestmark = pytest.mark.no_cover
+
+# Captured before any test patches them, for the tests that need real delivery
+_real_signal = signal.signal
+_real_set_wakeup_fd = signal.set_wakeup_fd
+
+HANDLED_SIGNALS = [
+    getattr(signal, name) for name in ("SIGTERM", "SIGINT", "SIGHUP", "SIGQUIT") if hasattr(signal, name)
+]
+
+def _no_wakeup_fd(fd, *args, **kwargs):
+    """Refuse the wakeup fd the way a non-main thread would, so no signal thread starts."""
+    raise ValueError("set_wakeup_fd only works in main thread")
+
+def _current_wakeup_fd():
+    fd = _real_set_wakeup_fd(-1)
+    _real_set_wakeup_fd(fd)
+    return fd
+
+@pytest.fixture(autouse=True)
+def patched_signal(monkeypatch):
+    """Record signal registrations instead of installing real handlers or a wakeup fd."""
+    calls = []
+    monkeypatch.setattr(shutdown_module.signal, "signal", lambda *args: calls.append(args))
+    monkeypatch.setattr(shutdown_module.signal, "set_wakeup_fd", _no_wakeup_fd)
+    return calls
+
+@pytest.fixture
+def real_signals(monkeypatch):
+    """Install real handlers, putting back the previous handlers and wakeup fd afterwards."""
+    monkeypatch.setattr(shutdown_module.signal, "signal", _real_signal)
+    monkeypatch.setattr(shutdown_module.signal, "set_wakeup_fd", _real_set_wakeup_fd)
+    handlers = {signum: signal.getsignal(signum) for signum in HANDLED_SIGNALS}
+    wakeup_fd = _current_wakeup_fd()
+    yield handlers, wakeup_fd
+    for signum, handler in handlers.items():
+        if handler is not None:
+            _real_signal(signum, handler)
+    _real_set_wakeup_fd(wakeup_fd)
+
+@pytest.fixture
+def fake_driver():
+    """Create a fake WebDriver that counts quit() calls."""
+    return FakeDriver()
+
+@pytest.fixture
+def patched_unlink(monkeypatch):
+    """Replace os.unlink as seen by the shutdown module with a Mock."""
+    unlink = Mock()
+    monkeypatch.setattr(shutdown_module.os, "unlink", unlink)
+    return unlink
+
+@pytest.fixture(scope="module")
+def shared_manager():
+    """Create one shutdown manager for the module, without real signal handlers."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(shutdown_module.signal, "signal", lambda *args: None)
+        mp.setattr(shutdown_module.signal, "set_wakeup_fd", _no_wakeup_fd)
+        shared = ShutdownManager()
+    yield shared
+    shared.reset()
+
+@pytest.fixture
+def manager(shared_manager):
+    """Hand out the shared shutdown manager with nothing registered."""
+    shared_manager.reset()
+    return shared_manager
 
 def test_shutdown_manager_initialization():
     """Test basic initialization of shutdown manager."""
@@ -15,127 +98,278 @@ def test_shutdown_manager_initialization():
     assert len(manager.temp_files) == 0
     assert len(manager.cleanup_callbacks) == 0
 
-def test_browser_registration():
-    """Test browser registration and cleanup."""
-    manager = ShutdownManager()
-    mock_driver = Mock(spec=webdriver.Remote)
-    
-    # Register and verify
-    manager.register_browser(mock_driver)
-    assert manager.driver == mock_driver
-    
-    # Test cleanup
+def _register_all(manager, driver, path, callback):
+    """Register a browser, a temp file and a cleanup callback."""
+    manager.register_browser(driver)
+    manager.register_temp_file(path)
+    manager.register_cleanup_callback(callback)
+
+def _browser_setup(manager, resources):
+    manager.register_browser(resources["driver"])
+    assert manager.driver == resources["driver"]
     manager.cleanup_browser()
-    mock_driver.quit.assert_called_once()
+
+def _browser_verify(manager, resources):
+    assert resources["driver"].quit_calls == 1
     assert manager.driver is None
 
-def test_temp_file_registration():
-    """Test temporary file registration and cleanup."""
-    manager = ShutdownManager()
-    test_path = "/tmp/test_file.txt"
+def _tempfile_setup(manager, resources):
+    manager.register_temp_file(resources["path"])
+    assert resources["path"] in manager.temp_files
+    # Registering the same file twice only removes it once
+    manager.register_temp_file(Path(resources["path"]))
+    assert len(manager.temp_files) == 1
+    manager.cleanup_temp_files()
+
+def _tempfile_verify(manager, resources):
+    resources["unlink"].assert_called_once_with(resources["path"])
+    assert len(manager.temp_files) == 0
+
+def _callback_setup(manager, resources):
+    manager.register_cleanup_callback(resources["callback"])
+    assert resources["callback"] in manager.cleanup_callbacks
+    manager.run_cleanup_callbacks()
+
+def _callback_verify(manager, resources):
+    assert resources["callback"].calls == 1
+    assert len(manager.cleanup_callbacks) == 0
+
+LIFECYCLE_CASES = [
+    ("browser", _browser_setup, _browser_verify),
+    ("tempfile", _tempfile_setup, _tempfile_verify),
+    ("callback", _callback_setup, _callback_verify),
+]
+
+@pytest.mark.parametrize("kind,setup,verify", LIFECYCLE_CASES, ids=[case[0] for case in LIFECYCLE_CASES])
+def test_resource_lifecycle(patched_unlink, manager, fake_driver, kind, setup, verify):
+    """Test registering and cleaning up each kind of resource."""
+    resources = {
+        "driver": fake_driver,
+        "path": "/tmp/test_file.txt",
+        "callback": FakeCallback(),
+        "unlink": patched_unlink,
+    }
+    setup(manager, resources)
+    verify(manager, resources)
+
+def test_temp_file_cleanup_missing_and_directories(manager, tmp_path):
+    """Test that missing files are skipped and directories are removed."""
+    temp_dir = tmp_path / "profile"
+    temp_dir.mkdir()
+    (temp_dir / "cache").write_text("data")
     
-    # Register and verify
-    manager.register_temp_file(test_path)
-    assert test_path in manager.temp_files
+    manager.register_temp_file(tmp_path / "missing.txt")
+    manager.register_temp_file(temp_dir)
+    manager.cleanup_temp_files()
     
-    # Test cleanup with mocked Path operations
-    with patch('star_citizen_checkout.shutdown.Path') as mock_path_class:
-        mock_path_instance = Mock()
-        mock_path_class.return_value = mock_path_instance
-        mock_path_instance.exists.return_value = True
-        
-        manager.cleanup_temp_files()
-        
-        mock_path_class.assert_called_once_with(test_path)
-        mock_path_instance.exists.assert_called_once()
-        mock_path_instance.unlink.assert_called_once()
-        assert len(manager.temp_files) == 0
+    assert not temp_dir.exists()
+    assert len(manager.temp_files) == 0
 
-def test_cleanup_callback():
-    """Test cleanup callback registration and execution."""
-    manager = ShutdownManager()
-    mock_callback = Mock()
+def test_temp_dir_removed_when_unlink_raises_permission_error(manager, tmp_path, patched_unlink):
+    """Test that directories are removed on platforms where unlink raises PermissionError."""
+    temp_dir = tmp_path / "profile"
+    temp_dir.mkdir()
+    patched_unlink.side_effect = PermissionError("Operation not permitted")
     
-    # Register and verify
-    manager.register_cleanup_callback(mock_callback)
-    assert mock_callback in manager.cleanup_callbacks
+    manager.register_temp_file(temp_dir)
+    manager.cleanup_temp_files()
     
-    # Test execution
-    manager.run_cleanup_callbacks()
-    mock_callback.assert_called_once()
-    assert len(manager.cleanup_callbacks) == 0
+    assert not temp_dir.exists()
 
-@patch('star_citizen_checkout.shutdown.Path')
-def test_complete_shutdown(mock_path_class):
+def test_complete_shutdown(patched_unlink, manager, fake_driver):
     """Test complete shutdown procedure."""
-    manager = ShutdownManager()
     test_path = "/tmp/test_file.txt"
     
-    # Setup mocks
-    mock_driver = Mock(spec=webdriver.Remote)
-    mock_path_instance = Mock()
-    mock_path_class.return_value = mock_path_instance
-    mock_path_instance.exists.return_value = True
-    mock_callback = Mock()
+    # Setup fakes
+    fake_callback = FakeCallback()
     
     # Register everything
-    manager.register_browser(mock_driver)
-    manager.register_temp_file(test_path)
-    manager.register_cleanup_callback(mock_callback)
+    _register_all(manager, fake_driver, test_path, fake_callback)
     
     # Execute shutdown
     manager.shutdown("Test shutdown")
     
     # Verify all cleanups occurred
-    mock_driver.quit.assert_called_once()
-    mock_path_class.assert_called_once_with(test_path)
-    mock_path_instance.exists.assert_called_once()
-    mock_path_instance.unlink.assert_called_once()
-    mock_callback.assert_called_once()
+    assert fake_driver.quit_calls == 1
+    patched_unlink.assert_called_once_with(test_path)
+    assert fake_callback.calls == 1
     
     # Verify all collections cleared
     assert manager.driver is None
     assert len(manager.temp_files) == 0
     assert len(manager.cleanup_callbacks) == 0
 
-@patch('signal.signal')
-def test_signal_handling(mock_signal):
+def test_signal_handling(patched_signal):
     """Test signal handler registration."""
     manager = ShutdownManager()
     
     # Verify signal handlers were registered
-    assert mock_signal.call_count == 2
-    mock_signal.assert_any_call(signal.SIGTERM, manager._handle_signal)
-    mock_signal.assert_any_call(signal.SIGINT, manager._handle_signal)
+    expected = [signal.SIGTERM, signal.SIGINT]
+    for name in ("SIGHUP", "SIGQUIT"):
+        if hasattr(signal, name):
+            expected.append(getattr(signal, name))
+    assert len(patched_signal) == len(expected)
+    for signum in expected:
+        assert (signum, manager._handle_signal) in patched_signal
 
-@patch('star_citizen_checkout.shutdown.Path')
-def test_error_handling(mock_path_class):
+def test_shutdown_is_idempotent(manager, fake_driver):
+    """Test that a second shutdown request does not clean up twice."""
+    manager.register_browser(fake_driver)
+    
+    manager.shutdown("First signal")
+    manager.register_browser(fake_driver)
+    manager.shutdown("Second signal")
+    
+    assert fake_driver.quit_calls == 1
+
+def test_reset_clears_registrations_and_allows_shutdown(manager, fake_driver):
+    """Test that reset forgets resources and re-arms shutdown."""
+    manager.register_browser(FakeDriver())
+    manager.shutdown("Before reset")
+    manager.register_temp_file("/tmp/test_reset.txt")
+    manager.register_cleanup_callback(FakeCallback())
+    
+    manager.reset()
+    assert manager.driver is None
+    assert len(manager.temp_files) == 0
+    assert len(manager.cleanup_callbacks) == 0
+    
+    manager.register_browser(fake_driver)
+    manager.shutdown("After reset")
+    assert fake_driver.quit_calls == 1
+
+def test_error_handling(patched_unlink, manager, fake_driver):
     """Test error handling during cleanup."""
-    manager = ShutdownManager()
     test_path = "/tmp/test_error.txt"
     
     # Setup failing mocks
-    mock_driver = Mock(spec=webdriver.Remote)
-    mock_driver.quit.side_effect = Exception("Browser cleanup failed")
+    fake_driver.quit_side_effect = Exception("Browser cleanup failed")
     
-    mock_path_instance = Mock()
-    mock_path_class.return_value = mock_path_instance
-    mock_path_instance.exists.return_value = True
-    mock_path_instance.unlink.side_effect = Exception("File cleanup failed")
+    patched_unlink.side_effect = Exception("File cleanup failed")
     
-    mock_callback = Mock(side_effect=Exception("Callback failed"))
+    fake_callback = FakeCallback(side_effect=Exception("Callback failed"))
     
     # Register everything
-    manager.register_browser(mock_driver)
-    manager.register_temp_file(test_path)
-    manager.register_cleanup_callback(mock_callback)
+    _register_all(manager, fake_driver, test_path, fake_callback)
     
     # Shutdown should complete without raising exceptions
     manager.shutdown("Test error handling")
     
     # Verify all cleanups were attempted
-    mock_driver.quit.assert_called_once()
-    mock_path_class.assert_called_once_with(test_path)
-    mock_path_instance.exists.assert_called_once()
-    mock_path_instance.unlink.assert_called_once()
-    mock_callback.assert_called_once()
+    assert fake_driver.quit_calls == 1
+    patched_unlink.assert_called_once_with(test_path)
+    assert fake_callback.calls == 1
+
+def test_shutdown_does_not_wait_on_hung_browser(fake_driver):
+    """Test that a hung browser quit doesn't block the other cleanup phases."""
+    # The abandoned quit finishes after the test, so keep it off the shared manager
+    manager = ShutdownManager()
+    release = threading.Event()
+    fake_driver.quit_side_effect = lambda: release.wait(5)
+    fake_callback = FakeCallback()
+    manager.register_browser(fake_driver)
+    manager.register_cleanup_callback(fake_callback)
+    
+    with patch.object(shutdown_module, "SHUTDOWN_TIMEOUT", 0.2):
+        manager.shutdown("Test hung browser")
+    
+    assert fake_callback.calls == 1
+    # The abandoned phase must not be joined at interpreter exit
+    hung = [t for t in threading.enumerate() if t.name == "shutdown-browser"]
+    assert hung and all(t.daemon for t in hung)
+    release.set()
+
+# Stands in for chromedriver: starts a "browser" child and waits
+_DRIVER_SCRIPT = (
+    "import subprocess, sys, time; "
+    "subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(30)']); "
+    "time.sleep(30)"
+)
+
+def test_hung_quit_kills_driver_and_browser_processes(manager):
+    """Test that a quit that hangs past the watchdog kills the driver and its children."""
+    driver_process = subprocess.Popen([sys.executable, "-c", _DRIVER_SCRIPT])
+    try:
+        deadline = time.monotonic() + 10
+        while not psutil.Process(driver_process.pid).children() and time.monotonic() < deadline:
+            time.sleep(0.05)
+        browser_processes = psutil.Process(driver_process.pid).children(recursive=True)
+        assert browser_processes, "Driver stand-in did not start its child"
+        
+        mock_driver = Mock()
+        mock_driver.service.process = driver_process
+        mock_driver.quit.side_effect = lambda: time.sleep(0.3)
+        manager.register_browser(mock_driver)
+        
+        with patch.object(shutdown_module, "QUIT_TIMEOUT", 0.05):
+            manager.cleanup_browser()
+        
+        assert driver_process.wait(5) is not None
+        _, alive = psutil.wait_procs(browser_processes, timeout=5)
+        assert alive == []
+    finally:
+        driver_process.kill()
+        driver_process.wait()
+
+def test_signal_runs_shutdown_on_signal_thread(real_signals):
+    """Test that a delivered signal triggers shutdown outside the handler."""
+    manager = ShutdownManager()
+    try:
+        assert manager._signal_thread is not None
+        done = threading.Event()
+        manager.register_cleanup_callback(done.set)
+        
+        os.kill(os.getpid(), signal.SIGTERM)
+        
+        assert done.wait(5), "Shutdown did not run after SIGTERM"
+    finally:
+        manager.close()
+
+def test_close_restores_signal_state(real_signals):
+    """Test that close hands back the handlers and wakeup fd and stops the thread."""
+    handlers, wakeup_fd = real_signals
+    manager = ShutdownManager()
+    thread = manager._signal_thread
+    assert thread is not None
+    
+    manager.close()
+    
+    for signum, handler in handlers.items():
+        assert signal.getsignal(signum) == handler
+    assert _current_wakeup_fd() == wakeup_fd
+    assert not thread.is_alive()
+
+def test_signal_handled_directly_when_wakeup_fd_replaced(real_signals):
+    """Test that signals still shut down after another component takes the wakeup fd."""
+    manager = ShutdownManager()
+    done = threading.Event()
+    manager.register_cleanup_callback(done.set)
+    receiver, sender = socket.socketpair()
+    sender.setblocking(False)
+    try:
+        signal.set_wakeup_fd(sender.fileno())
+        os.kill(os.getpid(), signal.SIGTERM)
+        assert done.wait(5), "Shutdown did not run after SIGTERM"
+    finally:
+        manager.close()
+        receiver.close()
+        sender.close()
+
+def test_bound_method_callbacks_are_weak(manager):
+    """Test that bound method callbacks don't keep their owner alive."""
+    class Owner:
+        def __init__(self):
+            self.cleaned = False
+        
+        def cleanup(self):
+            self.cleaned = True
+    
+    kept, dropped = Owner(), Owner()
+    manager.register_cleanup_callback(kept.cleanup)
+    manager.register_cleanup_callback(dropped.cleanup)
+    del dropped
+    gc.collect()
+    
+    manager.run_cleanup_callbacks()
+    assert kept.cleaned
+    assert len(manager.cleanup_callbacks) == 0